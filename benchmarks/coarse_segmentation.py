@@ -0,0 +1,63 @@
+"""Energy segmentation: single-stage framing versus the coarse-to-fine detector.
+
+Builds noisy recordings with a varying number of cough-like bursts per
+minute and times both detectors on each, checking that the boundaries match.
+Run from the repository root:
+
+    python -m benchmarks.coarse_segmentation [minutes]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from src.analysis import preprocessing
+
+SAMPLE_RATE = 16_000
+FRAME_LENGTH = 320
+HOP_LENGTH = 160
+MIN_DURATION = 0.1
+DENSITIES = (0, 1, 5, 20, 60, 120)  # bursts per minute
+
+
+def synthesize(minutes: float, bursts_per_minute: int, rng: np.random.Generator) -> np.ndarray:
+    """Low-level noise with decaying noise bursts of 0.2-0.5 s at random positions."""
+    signal = rng.normal(scale=0.005, size=int(minutes * 60 * SAMPLE_RATE))
+    for _ in range(int(minutes * bursts_per_minute)):
+        length = int(rng.uniform(0.2, 0.5) * SAMPLE_RATE)
+        start = int(rng.integers(0, signal.size - length))
+        envelope = np.exp(-np.linspace(0.0, 5.0, length))
+        signal[start : start + length] += rng.uniform(0.3, 1.0) * envelope * rng.normal(size=length)
+    return signal
+
+
+def timed(function, *args) -> tuple[float, list[tuple[int, int]]]:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    rng = np.random.default_rng(0)
+
+    print(f"{minutes:g} min of 16 kHz audio, frame {FRAME_LENGTH}, hop {HOP_LENGTH}")
+    print(f"{'bursts/min':>10} {'refined':>8} {'single':>8} {'coarse':>8} {'speedup':>8}")
+    for density in DENSITIES:
+        signal = synthesize(minutes, density, rng)
+        threshold = 0.1 * float(np.max(np.abs(signal)))
+        args = (signal, SAMPLE_RATE, FRAME_LENGTH, HOP_LENGTH, threshold, MIN_DURATION)
+
+        single_elapsed, expected = timed(preprocessing.segment_by_energy, *args)
+        coarse_elapsed, actual = timed(preprocessing.segment_by_energy_coarse_to_fine, *args)
+        if actual != expected:
+            raise AssertionError(f"Boundaries differ at {density} bursts/min")
+
+        candidates = preprocessing.candidate_frames(signal, FRAME_LENGTH, HOP_LENGTH, threshold)
+        print(
+            f"{density:>10} {candidates.mean():>7.1%} {single_elapsed:>7.3f}s {coarse_elapsed:>7.3f}s "
+            f"{single_elapsed / coarse_elapsed:>7.1f}x"
+        )
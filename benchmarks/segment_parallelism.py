@@ -0,0 +1,62 @@
+"""Scaling of intra-file segment parallelism on a long synthetic recording.
+
+Run from the repository root:
+
+    python -m benchmarks.segment_parallelism [minutes]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src import main
+from src.utils import audio_io
+
+SAMPLE_RATE = 16_000
+
+
+def write_long_recording(path: Path, minutes: float, bursts_per_second: float = 1.0) -> None:
+    """Low-level noise with a short voiced burst every ``1 / bursts_per_second`` seconds."""
+    rng = np.random.default_rng(0)
+    signal = rng.normal(scale=0.01, size=int(minutes * 60 * SAMPLE_RATE))
+    burst_length = int(0.25 * SAMPLE_RATE)
+    t = np.arange(burst_length) / SAMPLE_RATE
+    step = int(SAMPLE_RATE / bursts_per_second)
+    for start in range(step // 4, signal.size - burst_length, step):
+        f0 = rng.uniform(120, 300)
+        burst = sum(np.sin(2 * np.pi * k * f0 * t) / k for k in range(1, 5))
+        signal[start : start + burst_length] += 0.4 * burst * np.hanning(burst_length)
+    audio_io.save_wav(str(path), np.clip(signal, -1.0, 1.0), SAMPLE_RATE)
+
+
+def time_run(path: Path, config: main.PipelineConfig) -> tuple[float, int]:
+    start = time.perf_counter()
+    records = list(main.iter_features(input_file=str(path), config=config))
+    return time.perf_counter() - start, len(records)
+
+
+if __name__ == "__main__":
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpus})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "long.wav"
+        write_long_recording(path, minutes)
+        print(f"{minutes:g} min synthetic recording, {cpus} CPU(s)")
+
+        baseline, n_segments = time_run(path, main.PipelineConfig())
+        print(f"sequential: {baseline:.2f} s for {n_segments} segments")
+        for executor in ("thread", "process"):
+            for workers in worker_counts:
+                if workers == 1:
+                    continue
+                config = main.PipelineConfig(segment_workers=workers, segment_executor=executor)
+                elapsed, _ = time_run(path, config)
+                print(f"{executor:7s} x{workers}: {elapsed:.2f} s (speedup {baseline / elapsed:.2f}x)")
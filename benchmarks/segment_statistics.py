@@ -0,0 +1,77 @@
+"""Per-segment scalar statistics: direct functions versus the prefix-sum SignalIndex.
+
+Run from the repository root:
+
+    python -m benchmarks.segment_statistics [n_segments]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from src.analysis import features, preprocessing
+from src.analysis.signal_index import SignalIndex
+
+SAMPLE_RATE = 16_000
+FRAME_LENGTH = 320
+HOP_LENGTH = 160
+
+
+def direct(signal: np.ndarray, segments: list[tuple[int, int]]) -> list[tuple[float, float, float, np.ndarray]]:
+    results = []
+    for start, end in segments:
+        segment = preprocessing.normalize_energy(signal[start:end])
+        results.append(
+            (
+                features.calculate_rms_energy(segment),
+                features.calculate_zcr(segment),
+                features.calculate_crest_factor(segment),
+                features.calculate_amplitude_contour(segment, FRAME_LENGTH, HOP_LENGTH),
+            )
+        )
+    return results
+
+
+def indexed(index: SignalIndex, segments: list[tuple[int, int]]) -> list[tuple[float, float, float, np.ndarray]]:
+    return [
+        (
+            index.rms(start, end),
+            index.zcr(start, end),
+            index.crest_factor(start, end),
+            index.amplitude_contour(start, end, FRAME_LENGTH, HOP_LENGTH),
+        )
+        for start, end in segments
+    ]
+
+
+if __name__ == "__main__":
+    n_segments = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    rng = np.random.default_rng(0)
+    lengths = rng.integers(int(0.1 * SAMPLE_RATE), int(0.6 * SAMPLE_RATE), n_segments)
+    gaps = rng.integers(int(0.05 * SAMPLE_RATE), int(0.5 * SAMPLE_RATE), n_segments)
+    starts = np.cumsum(gaps + np.concatenate(([0], lengths[:-1])))
+    segments = [(int(start), int(start + length)) for start, length in zip(starts, lengths)]
+    signal = rng.normal(scale=0.1, size=segments[-1][1] + SAMPLE_RATE)
+
+    start = time.perf_counter()
+    expected = direct(signal, segments)
+    direct_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = SignalIndex(signal)
+    build_elapsed = time.perf_counter() - start
+    actual = indexed(index, segments)
+    indexed_elapsed = time.perf_counter() - start
+
+    max_error = max(
+        max(abs(a[0] - e[0]), abs(a[1] - e[1]), abs(a[2] - e[2]), float(np.max(np.abs(a[3] - e[3]))))
+        for a, e in zip(actual, expected)
+    )
+    print(f"{n_segments} segments over {signal.size / SAMPLE_RATE / 60:.1f} min of audio")
+    print(f"direct:  {direct_elapsed:.3f} s")
+    print(f"indexed: {indexed_elapsed:.3f} s ({build_elapsed:.3f} s index build, "
+          f"{indexed_elapsed - build_elapsed:.3f} s queries)")
+    print(f"speedup: {direct_elapsed / indexed_elapsed:.1f}x, max abs difference {max_error:.2e}")
@@ -0,0 +1,99 @@
+"""Accuracy and throughput comparison of the Praat and fast vowel backends.
+
+Run from the repository root:
+
+    python -m benchmarks.vowel_backends
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import parselmouth
+
+from src.analysis import features
+from src.utils import audio_io
+
+SAMPLE_RATE = 16_000
+MEASURES = ("F0", "HNR", "Jitter", "Shimmer")
+
+
+def synthesize_voiced(
+    f0: float,
+    jitter: float,
+    shimmer: float,
+    snr_db: float,
+    duration: float = 0.5,
+    seed: int = 0,
+) -> np.ndarray:
+    """Concatenate harmonic glottal cycles with random period/amplitude perturbation."""
+    rng = np.random.default_rng(seed)
+    cycles = []
+    total = 0
+    target = int(duration * SAMPLE_RATE)
+    while total < target:
+        period = SAMPLE_RATE / f0 * (1 + jitter * rng.standard_normal())
+        amplitude = 1 + shimmer * rng.standard_normal()
+        phase = np.arange(int(round(period))) / period
+        cycle = sum(np.sin(2 * np.pi * k * phase) / k for k in range(1, 6))
+        cycles.append(amplitude * cycle)
+        total += cycle.size
+    signal = np.concatenate(cycles)[:target]
+    noise = rng.standard_normal(signal.size) * np.std(signal) * 10 ** (-snr_db / 20)
+    return signal + noise
+
+
+def _praat(signal: np.ndarray) -> dict[str, float]:
+    return features.analyze_vowel(parselmouth.Sound(signal, sampling_frequency=SAMPLE_RATE), SAMPLE_RATE)
+
+
+def accuracy_report() -> None:
+    cases = []
+    for f0 in (110.0, 180.0, 260.0):
+        for jitter, shimmer in ((0.005, 0.03), (0.01, 0.06)):
+            for snr_db in (30.0, 15.0):
+                cases.append((f"synthetic f0={f0:.0f} j={jitter} s={shimmer} snr={snr_db:.0f}",
+                              synthesize_voiced(f0, jitter, shimmer, snr_db, seed=len(cases))))
+    sample, rate = audio_io.load_wav("tests/test_data/sample.wav")
+    assert rate == SAMPLE_RATE
+    cases.append(("tests/test_data/sample.wav", sample))
+
+    print(f"{'signal':44s} " + " ".join(f"{m:>19s}" for m in MEASURES))
+    print(f"{'':44s} " + " ".join(f"{'praat / fast':>19s}" for _ in MEASURES))
+    for name, signal in cases:
+        praat, fast = _praat(signal), features.analyze_vowel_fast(signal, SAMPLE_RATE)
+        cells = []
+        for measure in MEASURES:
+            scale = 100.0 if measure in ("Jitter", "Shimmer") else 1.0
+            cells.append(f"{praat[measure] * scale:9.3f}/{fast[measure] * scale:9.3f}")
+        print(f"{name:44s} " + " ".join(cells))
+    print("(Jitter and Shimmer in percent)")
+
+
+def throughput_report(n_segments: int = 200) -> None:
+    rng = np.random.default_rng(1)
+    segments = [
+        synthesize_voiced(rng.uniform(100, 300), 0.01, 0.05, 20.0, duration=rng.uniform(0.2, 0.6), seed=i)
+        for i in range(n_segments)
+    ]
+    total_seconds = sum(segment.size for segment in segments) / SAMPLE_RATE
+
+    start = time.perf_counter()
+    for segment in segments:
+        _praat(segment)
+    praat_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    features.analyze_vowels_fast(segments, SAMPLE_RATE)
+    fast_elapsed = time.perf_counter() - start
+
+    print(f"\n{n_segments} segments, {total_seconds:.1f} s of audio")
+    print(f"praat: {praat_elapsed:.3f} s ({n_segments / praat_elapsed:.0f} segments/s)")
+    print(f"fast:  {fast_elapsed:.3f} s ({n_segments / fast_elapsed:.0f} segments/s)")
+    print(f"speedup: {praat_elapsed / fast_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    accuracy_report()
+    throughput_report()
@@ -7,7 +7,8 @@ import math
 import numpy as np
 import parselmouth
 from parselmouth.praat import call
-from scipy.fft import dct
+from scipy.fft import dct, irfft, next_fast_len, rfft
+from scipy.signal import find_peaks
 from scipy.stats import kurtosis
 
 def calculate_length(segment: np.ndarray, sample_rate: int) -> float:
@@ -214,4 +215,237 @@ def analyze_vowel(sound: parselmouth.Sound, sample_rate: int | None = None) -> d
         "HNR": hnr,
         "Jitter": max(jitter, 0.0),
         "Shimmer": max(shimmer, 0.0),
-    }
\ No newline at end of file
+    }
+
+VOWEL_BACKENDS = ("praat", "fast")
+
+FAST_PITCH_FLOOR = 75.0
+FAST_PITCH_CEILING = 500.0
+FAST_VOICING_THRESHOLD = 0.45
+FAST_SILENCE_THRESHOLD = 0.03
+FAST_OCTAVE_COST = 0.01
+FAST_TIME_STEP = 0.01
+_MIN_PERIOD = 0.0001
+_MAX_PERIOD = 0.02
+_PERIOD_FACTOR = 1.3
+_AMPLITUDE_FACTOR = 1.6
+_SMOOTHING_KERNEL = np.array([0.25, 0.5, 0.25])
+
+
+def _frame_segments(
+    signals: list[np.ndarray], frame_length: int, hop_length: int
+) -> tuple[np.ndarray, np.ndarray, list[int]]:
+    """Stack overlapping frames of all segments and return (frames, owner index, counts)."""
+    frames = []
+    counts = []
+    for signal in signals:
+        if len(signal) < frame_length:
+            padded = np.pad(signal, (0, frame_length - len(signal)))
+            framed = padded[np.newaxis, :]
+        else:
+            framed = np.lib.stride_tricks.sliding_window_view(signal, frame_length)[::hop_length]
+        frames.append(framed)
+        counts.append(framed.shape[0])
+
+    if not frames:
+        return np.zeros((0, frame_length)), np.zeros(0, dtype=int), counts
+
+    owners = np.repeat(np.arange(len(signals)), counts)
+    return np.concatenate(frames, axis=0), owners, counts
+
+
+def _normalized_cross_correlation(frames: np.ndarray, max_lag: int) -> np.ndarray:
+    """Normalized cross-correlation of each frame with itself for lags 0..max_lag.
+
+    ``r[tau] = sum(x[n] x[n+tau]) / sqrt(sum(x[n]^2) sum(x[n+tau]^2))`` over
+    the overlapping part of the frame, computed for all frames with one FFT.
+    """
+    n_samples = frames.shape[1]
+    centered = frames - frames.mean(axis=1, keepdims=True)
+    n_fft = next_fast_len(n_samples + max_lag + 1, real=True)
+    spectrum = rfft(centered, n_fft, axis=1, workers=-1)
+    autocorrelation = irfft(np.abs(spectrum) ** 2, n_fft, axis=1, workers=-1)[:, : max_lag + 1]
+
+    energy = np.concatenate(
+        [np.zeros((frames.shape[0], 1)), np.cumsum(centered**2, axis=1)], axis=1
+    )
+    lags = np.arange(max_lag + 1)
+    head_energy = energy[:, n_samples - lags]
+    tail_energy = energy[:, -1:] - energy[:, lags]
+    denominator = np.sqrt(head_energy * tail_energy)
+
+    return np.divide(
+        autocorrelation, denominator, out=np.zeros_like(autocorrelation), where=denominator > 0
+    )
+
+
+def _parabolic_peak(y0: np.ndarray, y1: np.ndarray, y2: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sub-sample offset and height of the parabola through three neighbouring samples."""
+    curvature = y0 - 2 * y1 + y2
+    offset = np.divide(0.5 * (y0 - y2), curvature, out=np.zeros_like(y1), where=curvature < 0)
+    offset = np.clip(offset, -0.5, 0.5)
+    return offset, y1 - 0.25 * (y0 - y2) * offset
+
+
+def _pick_periods(
+    correlation: np.ndarray, sample_rate: int, min_lag: int, max_lag: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the interpolated best lag (samples) and correlation strength per frame."""
+    n_frames = correlation.shape[0]
+    candidates = np.arange(min_lag, max_lag)
+    centre = correlation[:, candidates]
+    left = correlation[:, candidates - 1]
+    right = correlation[:, candidates + 1]
+
+    is_peak = (centre >= left) & (centre > right) & (centre > 0)
+    octave_bonus = FAST_OCTAVE_COST * np.log2(sample_rate / candidates / FAST_PITCH_FLOOR)
+    score = np.where(is_peak, centre + octave_bonus, -np.inf)
+
+    best = np.argmax(score, axis=1)
+    rows = np.arange(n_frames)
+    has_peak = np.isfinite(score[rows, best])
+
+    offset, height = _parabolic_peak(left[rows, best], centre[rows, best], right[rows, best])
+    lags = candidates[best] + offset
+    strengths = np.minimum(height, 1.0)
+    return np.where(has_peak, lags, 0.0), np.where(has_peak, strengths, 0.0)
+
+
+def _cycle_periods(signal: np.ndarray, peaks: np.ndarray, period: float) -> np.ndarray:
+    """Periods between consecutive pulses from cycle-to-cycle waveform cross-correlation.
+
+    Each cycle around pulse ``i`` is matched against shifted cycles around
+    pulse ``i + 1``; the best (interpolated) shift corrects the raw peak
+    distance, which makes periods robust to noise on individual peaks.
+    """
+    width = max(int(round(period)), 2)
+    half = width // 2
+    max_shift = max(int(0.1 * period), 2)
+
+    first, second = peaks[:-1], peaks[1:]
+    usable = (first - half >= 0) & (second - half - max_shift - 1 >= 0)
+    usable &= second - half + max_shift + 1 + width <= len(signal)
+    periods = np.full(first.size, np.nan)
+    if not np.any(usable):
+        return periods
+
+    offsets = np.arange(width)
+    shifts = np.arange(-max_shift - 1, max_shift + 2)
+    reference = signal[(first[usable] - half)[:, np.newaxis] + offsets]
+    candidates = signal[
+        (second[usable] - half)[:, np.newaxis, np.newaxis] + shifts[np.newaxis, :, np.newaxis] + offsets
+    ]
+
+    dots = np.einsum("pw,psw->ps", reference, candidates)
+    norms = np.sqrt(np.sum(reference**2, axis=1)[:, np.newaxis] * np.sum(candidates**2, axis=2))
+    correlation = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+    best = np.argmax(correlation[:, 1:-1], axis=1) + 1
+    rows = np.arange(best.size)
+    offset, _ = _parabolic_peak(
+        correlation[rows, best - 1], correlation[rows, best], correlation[rows, best + 1]
+    )
+    periods[usable] = second[usable] - first[usable] + shifts[best] + offset
+    return periods
+
+
+def _pulse_perturbation(
+    signal: np.ndarray, sample_rate: int, voiced_mask: np.ndarray, period: float, floor: float
+) -> tuple[float, float]:
+    """Local jitter and shimmer from waveform pulses inside voiced regions."""
+    smoothed = np.convolve(signal, _SMOOTHING_KERNEL, mode="same")
+    gated = np.where(voiced_mask, smoothed, 0.0)
+    peaks, _ = find_peaks(gated, distance=max(int(0.7 * period), 1), height=floor)
+    peaks = peaks[(peaks > 0) & (peaks < len(signal) - 1)]
+    if peaks.size < 3:
+        return float("nan"), float("nan")
+
+    _, amplitudes = _parabolic_peak(smoothed[peaks - 1], smoothed[peaks], smoothed[peaks + 1])
+    periods = _cycle_periods(signal, peaks, period) / sample_rate
+
+    valid = np.isfinite(periods) & (periods >= _MIN_PERIOD) & (periods <= _MAX_PERIOD)
+    pair_valid = valid[:-1] & valid[1:]
+    safe = np.where(valid, periods, 1.0)
+    ratios = np.maximum(safe[:-1], safe[1:]) / np.minimum(safe[:-1], safe[1:])
+    pair_valid &= ratios <= _PERIOD_FACTOR
+    if not np.any(pair_valid):
+        return float("nan"), float("nan")
+
+    jitter = float(np.mean(np.abs(np.diff(safe))[pair_valid]) / np.mean(periods[valid]))
+
+    # Amplitude pairs (a[i+1], a[i+2]) belong to the periods (i, i+1) checked above.
+    amp_first, amp_second = amplitudes[1:-1], amplitudes[2:]
+    amp_ratios = np.maximum(amp_first, amp_second) / np.maximum(np.minimum(amp_first, amp_second), 1e-12)
+    amp_valid = pair_valid & (amp_ratios <= _AMPLITUDE_FACTOR)
+    if not np.any(amp_valid):
+        return jitter, float("nan")
+
+    shimmer = float(np.mean(np.abs(amp_first - amp_second)[amp_valid]) / np.mean(amp_first[amp_valid]))
+    return jitter, shimmer
+
+
+def analyze_vowels_fast(signals: list[np.ndarray], sample_rate: int) -> list[dict[str, float]]:
+    """
+    NumPy-native estimates of F0, HNR, jitter and shimmer for many segments.
+
+    Frames from all segments are stacked and analyzed together with one
+    FFT-based normalized cross-correlation, following the same definitions as
+    ``analyze_vowel`` (Praat cc pitch/harmonicity and local jitter/shimmer)
+    without constructing Praat objects. Undefined measures are NaN, as with
+    Praat.
+    """
+    frame_length = int(round(3 * sample_rate / FAST_PITCH_FLOOR))
+    hop_length = max(int(round(FAST_TIME_STEP * sample_rate)), 1)
+    min_lag = max(int(np.floor(sample_rate / FAST_PITCH_CEILING)), 1)
+    max_lag = min(int(np.ceil(sample_rate / FAST_PITCH_FLOOR)), frame_length // 2)
+
+    signals = [np.asarray(signal, dtype=float) for signal in signals]
+    frames, owners, counts = _frame_segments(signals, frame_length, hop_length)
+    if frames.shape[0] == 0:
+        return []
+
+    correlation = _normalized_cross_correlation(frames, max_lag + 1)
+    lags, strengths = _pick_periods(correlation, sample_rate, min_lag, max_lag)
+
+    global_peaks = np.array([np.max(np.abs(signal)) if signal.size else 0.0 for signal in signals])
+    frame_peaks = np.max(np.abs(frames), axis=1)
+    audible = (frame_peaks > 0) & (frame_peaks >= FAST_SILENCE_THRESHOLD * global_peaks[owners])
+    voiced = audible & (lags > 0) & (strengths > FAST_VOICING_THRESHOLD)
+
+    clipped = np.clip(strengths, 1e-10, 1 - 1e-10)
+    frame_hnr = 10 * np.log10(clipped / (1 - clipped))
+
+    results = []
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    for index, signal in enumerate(signals):
+        rows = slice(offsets[index], offsets[index + 1])
+        segment_voiced = voiced[rows]
+        segment_audible = audible[rows]
+
+        if np.any(segment_voiced):
+            voiced_lags = lags[rows][segment_voiced]
+            f0 = float(np.mean(sample_rate / voiced_lags))
+            voiced_mask = np.zeros(len(signal), dtype=bool)
+            for frame_index in np.flatnonzero(segment_voiced):
+                start = frame_index * hop_length
+                voiced_mask[start : start + frame_length] = True
+            jitter, shimmer = _pulse_perturbation(
+                signal,
+                sample_rate,
+                voiced_mask,
+                float(np.median(voiced_lags)),
+                FAST_SILENCE_THRESHOLD * global_peaks[index],
+            )
+        else:
+            f0, jitter, shimmer = 0.0, float("nan"), float("nan")
+
+        hnr = float(np.mean(frame_hnr[rows][segment_audible])) if np.any(segment_audible) else float("nan")
+        results.append({"F0": f0, "HNR": hnr, "Jitter": jitter, "Shimmer": shimmer})
+
+    return results
+
+
+def analyze_vowel_fast(signal: np.ndarray, sample_rate: int) -> dict[str, float]:
+    """Single-segment convenience wrapper around ``analyze_vowels_fast``."""
+    results = analyze_vowels_fast([signal], sample_rate)
+    return results[0] if results else {"F0": 0.0, "HNR": float("nan"), "Jitter": float("nan"), "Shimmer": float("nan")}
@@ -19,21 +19,127 @@ def downsample_signal(signal: np.ndarray, original_rate: int, target_rate: int)
     return resample(signal, num_samples)
 
 
-def segment_by_energy(
+def calculate_frame_energy(signal: np.ndarray, frame_length: int, hop_length: int) -> np.ndarray:
+    """
+    Calculates the RMS energy of each analysis frame.
+
+    The result depends only on the framing, so it can be shared between
+    segmentations that differ in threshold or minimum duration.
+
+    Args:
+        signal: The input audio signal.
+        frame_length: The length of each frame in samples.
+        hop_length: The step size between frames in samples.
+
+    Returns:
+        One RMS value per frame.
+    """
+    return np.array([
+        np.sqrt(np.mean(signal[i:i+frame_length]**2))
+        for i in range(0, len(signal) - frame_length, hop_length)
+    ])
+
+
+def candidate_frames(
     signal: np.ndarray,
-    sample_rate: int,
     frame_length: int,
     hop_length: int,
     energy_threshold: float,
+    block_length: int | None = None,
+) -> np.ndarray:
+    """
+    Flags the analysis frames that may exceed an RMS threshold.
+
+    The signal is reduced to a decimated envelope of per-block energies
+    (sums of squares over ``block_length`` samples, vectorized). A frame's
+    energy can be no larger than the energy of the blocks it overlaps, so a
+    frame whose bound stays below ``energy_threshold`` is provably inactive.
+    The bound is slightly inflated to absorb floating-point rounding, which
+    can only add candidates, never drop an active frame.
+
+    Args:
+        signal: The input audio signal.
+        frame_length: The length of each frame in samples.
+        hop_length: The step size between frames in samples.
+        energy_threshold: The RMS threshold used for segmentation.
+        block_length: Envelope block size in samples; defaults to ``hop_length``.
+
+    Returns:
+        A boolean mask with one entry per frame of ``calculate_frame_energy``.
+    """
+    if frame_length <= 0 or hop_length <= 0:
+        raise ValueError("frame_length and hop_length must be positive integers")
+    block = block_length or hop_length
+    n_frames = len(range(0, len(signal) - frame_length, hop_length))
+    if n_frames == 0:
+        return np.zeros(0, dtype=bool)
+    if energy_threshold < 0:
+        return np.ones(n_frames, dtype=bool)
+
+    n_full = len(signal) // block
+    full_blocks = np.asarray(signal[: n_full * block]).reshape(n_full, block)
+    block_energy = np.einsum("ij,ij->i", full_blocks, full_blocks, dtype=np.float64)
+    if len(signal) > n_full * block:
+        tail = np.asarray(signal[n_full * block :], dtype=np.float64)
+        block_energy = np.append(block_energy, np.dot(tail, tail))
+
+    # Every frame lies within ``span`` consecutive blocks starting at its first block.
+    span = -(-(frame_length - 1) // block) + 1
+    window_energy = np.convolve(block_energy, np.ones(span), mode="full")[span - 1 :]
+    first_blocks = np.arange(n_frames) * hop_length // block
+    bound = window_energy[first_blocks] * (1 + 1e-3)
+    return bound > energy_threshold**2 * frame_length
+
+
+def calculate_frame_energy_coarse_to_fine(
+    signal: np.ndarray,
+    frame_length: int,
+    hop_length: int,
+    energy_threshold: float,
+    block_length: int | None = None,
+) -> np.ndarray:
+    """
+    Frame RMS values for thresholding, computed only where they can matter.
+
+    Frames flagged by ``candidate_frames`` are refined with exactly the
+    computation of ``calculate_frame_energy``; all others are reported as
+    ``0.0``. Thresholding the result at ``energy_threshold`` therefore gives
+    the same active frames as the single-stage energies, but the values are
+    only valid for that threshold (or a higher one).
+
+    Args:
+        signal: The input audio signal.
+        frame_length: The length of each frame in samples.
+        hop_length: The step size between frames in samples.
+        energy_threshold: The RMS threshold used for segmentation.
+        block_length: Envelope block size in samples; defaults to ``hop_length``.
+
+    Returns:
+        One RMS value per frame, zero for frames pruned by the coarse pass.
+    """
+    candidates = candidate_frames(signal, frame_length, hop_length, energy_threshold, block_length)
+    energy = np.zeros(candidates.size)
+    for frame in np.flatnonzero(candidates):
+        i = frame * hop_length
+        energy[frame] = np.sqrt(np.mean(signal[i:i+frame_length]**2))
+    return energy
+
+
+def segments_from_energy(
+    energy: np.ndarray,
+    signal_length: int,
+    sample_rate: int,
+    hop_length: int,
+    energy_threshold: float,
     min_duration: float,
 ) -> list[tuple[int, int]]:
     """
-    Segments an audio signal based on energy.
+    Converts frame energies into active segments.
 
     Args:
-        signal: The input audio signal.
+        energy: Frame RMS values from ``calculate_frame_energy``.
+        signal_length: The number of samples in the framed signal.
         sample_rate: The sample rate of the signal.
-        frame_length: The length of each frame in samples.
         hop_length: The step size between frames in samples.
         energy_threshold: The energy threshold to consider a frame as active.
         min_duration: The minimum duration of a segment in seconds.
@@ -42,12 +148,6 @@ def segment_by_energy(
         A list of tuples, where each tuple contains the start and end
         sample index of a detected segment.
     """
-    # Calculate RMS energy for each frame
-    energy = np.array([
-        np.sqrt(np.mean(signal[i:i+frame_length]**2))
-        for i in range(0, len(signal) - frame_length, hop_length)
-    ])
-
     # Find frames above the threshold
     is_active = energy > energy_threshold
 
@@ -69,11 +169,78 @@ def segment_by_energy(
     if start_frame is not None:
         if (len(is_active) - start_frame) >= min_segment_length_frames:
             start_sample = start_frame * hop_length
-            end_sample = len(signal)
+            end_sample = signal_length
             segments.append((start_sample, end_sample))
 
     return segments
 
+
+def segment_by_energy(
+    signal: np.ndarray,
+    sample_rate: int,
+    frame_length: int,
+    hop_length: int,
+    energy_threshold: float,
+    min_duration: float,
+) -> list[tuple[int, int]]:
+    """
+    Segments an audio signal based on energy.
+
+    Args:
+        signal: The input audio signal.
+        sample_rate: The sample rate of the signal.
+        frame_length: The length of each frame in samples.
+        hop_length: The step size between frames in samples.
+        energy_threshold: The energy threshold to consider a frame as active.
+        min_duration: The minimum duration of a segment in seconds.
+
+    Returns:
+        A list of tuples, where each tuple contains the start and end
+        sample index of a detected segment.
+    """
+    energy = calculate_frame_energy(signal, frame_length, hop_length)
+    return segments_from_energy(
+        energy, len(signal), sample_rate, hop_length, energy_threshold, min_duration
+    )
+
+
+def segment_by_energy_coarse_to_fine(
+    signal: np.ndarray,
+    sample_rate: int,
+    frame_length: int,
+    hop_length: int,
+    energy_threshold: float,
+    min_duration: float,
+    block_length: int | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Two-stage version of ``segment_by_energy`` with identical boundaries.
+
+    A vectorized pass over a block-energy envelope discards frames that
+    cannot exceed the threshold; only the remaining candidate regions are
+    framed at ``frame_length``/``hop_length``. The saving grows with the
+    fraction of silence in the recording.
+
+    Args:
+        signal: The input audio signal.
+        sample_rate: The sample rate of the signal.
+        frame_length: The length of each frame in samples.
+        hop_length: The step size between frames in samples.
+        energy_threshold: The energy threshold to consider a frame as active.
+        min_duration: The minimum duration of a segment in seconds.
+        block_length: Envelope block size in samples; defaults to ``hop_length``.
+
+    Returns:
+        A list of tuples, where each tuple contains the start and end
+        sample index of a detected segment.
+    """
+    energy = calculate_frame_energy_coarse_to_fine(
+        signal, frame_length, hop_length, energy_threshold, block_length
+    )
+    return segments_from_energy(
+        energy, len(signal), sample_rate, hop_length, energy_threshold, min_duration
+    )
+
 def filter_by_snr(
     signal: np.ndarray,
     segments: list[tuple[int, int]],
@@ -0,0 +1,145 @@
+"""Prefix-sum index answering segment-level scalar statistics without copying."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 256
+
+
+class SignalIndex:
+    """
+    Cumulative statistics of a whole-file signal for O(1)/O(log n) segment queries.
+
+    Holds prefix sums of squared samples and of sign changes, plus a sparse
+    table over per-block absolute maxima. Results match the per-segment
+    functions in ``features`` applied to ``normalize_energy(signal[start:end])``
+    (up to floating-point rounding), since peak normalization only rescales
+    RMS and the amplitude contour and leaves ZCR and crest factor unchanged.
+    """
+
+    def __init__(self, signal: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE):
+        if block_size <= 0:
+            raise ValueError("block_size must be a positive integer")
+
+        # Keep the caller's array (e.g. a float32 memmap) and only widen where sums need it.
+        self.signal = np.asarray(signal)
+        self.block_size = block_size
+
+        self._energy = np.empty(self.signal.size + 1)
+        self._energy[0] = 0.0
+        np.cumsum(np.square(self.signal, dtype=np.float64), out=self._energy[1:])
+
+        # int8 signs (-1, 0, 1) match ``np.sign`` in ``calculate_zcr`` at 1/8 of the float64 size.
+        signs = np.greater(self.signal, 0).view(np.int8) - np.less(self.signal, 0).view(np.int8)
+        self._crossings = np.zeros(self.signal.size, dtype=np.int32 if self.signal.size < 2**31 else np.int64)
+        np.cumsum(signs[1:] != signs[:-1], out=self._crossings[1:])
+        del signs
+
+        n_full = self.signal.size // block_size
+        full_blocks = self.signal[: n_full * block_size].reshape(n_full, block_size)
+        block_max = np.maximum(full_blocks.max(axis=1, initial=0.0), -full_blocks.min(axis=1, initial=0.0))
+        block_max = block_max.astype(np.float64)
+        if self.signal.size > n_full * block_size:
+            tail = self.signal[n_full * block_size :]
+            block_max = np.append(block_max, float(max(tail.max(), -tail.min())))
+
+        levels = [block_max]
+        width = 1
+        while 2 * width <= block_max.size:
+            previous = levels[-1]
+            levels.append(np.maximum(previous[:-width], previous[width:]))
+            width *= 2
+        self._block_max = levels
+
+    def __len__(self) -> int:
+        return self.signal.size
+
+    def energy(self, start: int, end: int) -> float:
+        """Sum of squared samples in ``[start, end)``."""
+        return max(float(self._energy[end] - self._energy[start]), 0.0)
+
+    def zero_crossings(self, start: int, end: int) -> int:
+        """Number of sign changes between consecutive samples in ``[start, end)``."""
+        if end - start < 2:
+            return 0
+        return int(self._crossings[end - 1]) - int(self._crossings[start])
+
+    def _blocks_max(self, first: int, last: int) -> float:
+        """Maximum over whole blocks ``[first, last)`` from the sparse table."""
+        level = int(math.log2(last - first))
+        table = self._block_max[level]
+        return float(max(table[first], table[last - (1 << level)]))
+
+    def peak(self, start: int, end: int) -> float:
+        """Maximum absolute sample value in ``[start, end)``."""
+        if end <= start:
+            return 0.0
+
+        first_block = -(-start // self.block_size)
+        last_block = end // self.block_size
+        if first_block >= last_block:
+            return self._samples_max(start, end)
+
+        peak = self._blocks_max(first_block, last_block)
+        head_end = first_block * self.block_size
+        tail_start = last_block * self.block_size
+        if head_end > start:
+            peak = max(peak, self._samples_max(start, head_end))
+        if end > tail_start:
+            peak = max(peak, self._samples_max(tail_start, end))
+        return peak
+
+    def _samples_max(self, start: int, end: int) -> float:
+        """Maximum absolute value of the raw samples ``[start, end)``."""
+        samples = self.signal[start:end]
+        return float(max(samples.max(), -samples.min()))
+
+    def rms(self, start: int, end: int, normalized: bool = True) -> float:
+        """RMS of the segment, by default of its peak-normalized version."""
+        length = end - start
+        if length <= 0:
+            return float("nan")
+        rms = math.sqrt(self.energy(start, end) / length)
+        if not normalized:
+            return rms
+        peak = self.peak(start, end)
+        return rms / peak if peak > 0 else rms
+
+    def zcr(self, start: int, end: int) -> float:
+        """Zero crossing rate, matching ``features.calculate_zcr``."""
+        if end - start < 2:
+            return 0.0
+        return self.zero_crossings(start, end) / (end - start - 1)
+
+    def crest_factor(self, start: int, end: int) -> float:
+        """Peak-to-RMS ratio, matching ``features.calculate_crest_factor``."""
+        if end <= start:
+            return 0.0
+        peak = self.peak(start, end)
+        if math.isclose(peak, 0.0):
+            return 0.0
+        rms = self.rms(start, end, normalized=False)
+        if math.isclose(rms, 0.0):
+            return float("inf")
+        return peak / rms
+
+    def amplitude_contour(
+        self, start: int, end: int, frame_length: int, hop_length: int, normalized: bool = True
+    ) -> np.ndarray:
+        """Frame-wise RMS contour, matching ``features.calculate_amplitude_contour``."""
+        if frame_length <= 0 or hop_length <= 0:
+            raise ValueError("frame_length and hop_length must be positive integers")
+        if end - start < frame_length:
+            return np.zeros(0, dtype=float)
+
+        frame_starts = np.arange(start, end - frame_length, hop_length)
+        energies = self._energy[frame_starts + frame_length] - self._energy[frame_starts]
+        contour = np.sqrt(np.maximum(energies, 0.0) / frame_length)
+        if normalized:
+            peak = self.peak(start, end)
+            if peak > 0:
+                contour /= peak
+        return contour
@@ -1,7 +1,15 @@
 """Frequency-domain feature extraction helpers."""
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Sequence
+
 import numpy as np
-from scipy.fft import rfft, rfftfreq
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import dct, rfft, rfftfreq
+from scipy.signal import get_window
 
 def calculate_relative_energy(signal: np.ndarray, sample_rate: int, bands: list[tuple[int, int]]) -> list[float]:
     """Calculates the relative energy in different frequency bands."""
@@ -26,4 +34,240 @@ def calculate_relative_energy(signal: np.ndarray, sample_rate: int, bands: list[
     for band_power in band_powers:
         relative_energies.append(band_power / total_band_power)
         
-    return relative_energies
\ No newline at end of file
+    return relative_energies
+
+
+DEFAULT_N_FFT = 512
+DEFAULT_N_MELS = 40
+DEFAULT_N_MFCC = 13
+ROLLOFF_PERCENT = 0.85
+_EPSILON = 1e-10
+
+
+@dataclass
+class Spectrogram:
+    """Short-time power spectrogram of one segment, shared by all spectral features."""
+
+    power: np.ndarray  # shape (n_frames, n_fft // 2 + 1)
+    sample_rate: int
+    n_fft: int
+    hop_length: int
+
+    @cached_property
+    def frequencies(self) -> np.ndarray:
+        return rfftfreq(self.n_fft, 1 / self.sample_rate)
+
+    @cached_property
+    def magnitude(self) -> np.ndarray:
+        return np.sqrt(self.power)
+
+    @property
+    def n_frames(self) -> int:
+        return self.power.shape[0]
+
+
+@lru_cache(maxsize=None)
+def _hann_window(n_fft: int) -> np.ndarray:
+    """Periodic Hann window, cached per FFT size."""
+    window = get_window("hann", n_fft)
+    window.flags.writeable = False
+    return window
+
+
+@lru_cache(maxsize=None)
+def mel_filterbank(
+    n_fft: int,
+    sample_rate: int,
+    n_mels: int = DEFAULT_N_MELS,
+) -> np.ndarray:
+    """
+    Builds a triangular mel filterbank, cached per (n_fft, sample_rate, n_mels).
+
+    Returns:
+        A read-only array of shape (n_mels, n_fft // 2 + 1).
+    """
+    def hz_to_mel(hz):
+        return 2595.0 * np.log10(1.0 + np.asarray(hz) / 700.0)
+
+    def mel_to_hz(mel):
+        return 700.0 * (10.0 ** (np.asarray(mel) / 2595.0) - 1.0)
+
+    bin_frequencies = rfftfreq(n_fft, 1 / sample_rate)
+    mel_points = np.linspace(hz_to_mel(0.0), hz_to_mel(sample_rate / 2), n_mels + 2)
+    hz_points = mel_to_hz(mel_points)
+
+    filterbank = np.zeros((n_mels, bin_frequencies.size))
+    for index in range(n_mels):
+        lower, center, upper = hz_points[index : index + 3]
+        rising = (bin_frequencies - lower) / (center - lower)
+        falling = (upper - bin_frequencies) / (upper - center)
+        filterbank[index] = np.maximum(0.0, np.minimum(rising, falling))
+
+    filterbank.flags.writeable = False
+    return filterbank
+
+
+def _frame_signal(signal: np.ndarray, n_fft: int, hop_length: int) -> np.ndarray:
+    """Split a signal into overlapping frames, zero-padding short signals to one frame."""
+    if len(signal) == 0:
+        return np.zeros((0, n_fft))
+    if len(signal) < n_fft:
+        signal = np.pad(signal, (0, n_fft - len(signal)))
+    return sliding_window_view(signal, n_fft)[::hop_length]
+
+
+def compute_spectrograms(
+    signals: Sequence[np.ndarray],
+    sample_rate: int,
+    n_fft: int = DEFAULT_N_FFT,
+    hop_length: int = DEFAULT_N_FFT // 4,
+) -> list[Spectrogram]:
+    """
+    Computes power spectrograms for several segments with a single batched FFT.
+
+    Frames from every segment are stacked into one matrix so the FFT runs
+    once per file rather than once per segment and feature.
+
+    Args:
+        signals: The segment signals.
+        sample_rate: The sample rate shared by all segments.
+        n_fft: The FFT size (and frame length) in samples.
+        hop_length: The step between frames in samples.
+
+    Returns:
+        One ``Spectrogram`` per input signal, in input order.
+    """
+    if n_fft <= 0 or hop_length <= 0:
+        raise ValueError("n_fft and hop_length must be positive integers")
+
+    frames = [_frame_signal(np.asarray(signal, dtype=float), n_fft, hop_length) for signal in signals]
+    if not frames:
+        return []
+
+    stacked = np.concatenate(frames, axis=0) * _hann_window(n_fft)
+    power = np.abs(rfft(stacked, axis=1)) ** 2
+    split_points = np.cumsum([frame.shape[0] for frame in frames])[:-1]
+
+    return [
+        Spectrogram(power=block, sample_rate=sample_rate, n_fft=n_fft, hop_length=hop_length)
+        for block in np.split(power, split_points, axis=0)
+    ]
+
+
+def compute_spectrogram(
+    signal: np.ndarray,
+    sample_rate: int,
+    n_fft: int = DEFAULT_N_FFT,
+    hop_length: int = DEFAULT_N_FFT // 4,
+) -> Spectrogram:
+    """Computes the power spectrogram of a single segment."""
+    return compute_spectrograms([signal], sample_rate, n_fft, hop_length)[0]
+
+
+def _frame_mean(values: np.ndarray) -> float:
+    """Average a per-frame feature, returning 0.0 when there are no frames."""
+    return float(np.mean(values)) if values.size else 0.0
+
+
+def spectral_centroid(spectrogram: Spectrogram) -> np.ndarray:
+    """Per-frame magnitude-weighted mean frequency."""
+    magnitude = spectrogram.magnitude
+    totals = magnitude.sum(axis=1)
+    weighted = magnitude @ spectrogram.frequencies
+    return np.divide(weighted, totals, out=np.zeros_like(totals), where=totals > 0)
+
+
+def spectral_bandwidth(spectrogram: Spectrogram) -> np.ndarray:
+    """Per-frame magnitude-weighted standard deviation around the centroid."""
+    magnitude = spectrogram.magnitude
+    totals = magnitude.sum(axis=1)
+    deviation = (spectrogram.frequencies[np.newaxis, :] - spectral_centroid(spectrogram)[:, np.newaxis]) ** 2
+    variance = np.divide(
+        (magnitude * deviation).sum(axis=1), totals, out=np.zeros_like(totals), where=totals > 0
+    )
+    return np.sqrt(variance)
+
+
+def spectral_rolloff(spectrogram: Spectrogram, roll_percent: float = ROLLOFF_PERCENT) -> np.ndarray:
+    """Per-frame frequency below which ``roll_percent`` of the spectral energy lies."""
+    if spectrogram.n_frames == 0:
+        return np.zeros(0)
+    cumulative = np.cumsum(spectrogram.power, axis=1)
+    thresholds = roll_percent * cumulative[:, -1:]
+    indices = np.argmax(cumulative >= thresholds, axis=1)
+    rolloff = spectrogram.frequencies[indices]
+    return np.where(cumulative[:, -1] > 0, rolloff, 0.0)
+
+
+def spectral_flatness(spectrogram: Spectrogram) -> np.ndarray:
+    """Per-frame ratio of geometric to arithmetic mean of the power spectrum."""
+    power = spectrogram.power + _EPSILON
+    geometric = np.exp(np.mean(np.log(power), axis=1))
+    return geometric / np.mean(power, axis=1)
+
+
+def spectral_flux(spectrogram: Spectrogram) -> np.ndarray:
+    """Euclidean distance between consecutive magnitude spectra."""
+    if spectrogram.n_frames < 2:
+        return np.zeros(0)
+    return np.sqrt(np.sum(np.diff(spectrogram.magnitude, axis=0) ** 2, axis=1))
+
+
+def mfcc(
+    spectrogram: Spectrogram,
+    n_mfcc: int = DEFAULT_N_MFCC,
+    n_mels: int = DEFAULT_N_MELS,
+) -> np.ndarray:
+    """Per-frame mel-frequency cepstral coefficients, shape (n_frames, n_mfcc)."""
+    filterbank = mel_filterbank(spectrogram.n_fft, spectrogram.sample_rate, n_mels)
+    mel_power = spectrogram.power @ filterbank.T
+    log_mel = 10.0 * np.log10(np.maximum(mel_power, _EPSILON))
+    if log_mel.shape[0] == 0:
+        return np.zeros((0, n_mfcc))
+    return dct(log_mel, type=2, axis=1, norm="ortho")[:, :n_mfcc]
+
+
+def band_relative_energy(spectrogram: Spectrogram, bands: list[tuple[int, int]]) -> list[float]:
+    """Relative energy per frequency band, summed over all frames of the spectrogram."""
+    power_spectrum = spectrogram.power.sum(axis=0)
+    frequencies = spectrogram.frequencies
+    band_powers = [
+        float(np.sum(power_spectrum[(frequencies >= low) & (frequencies < high)])) for low, high in bands
+    ]
+    total_band_power = sum(band_powers)
+    if total_band_power == 0:
+        return [0.0] * len(bands)
+    return [band_power / total_band_power for band_power in band_powers]
+
+
+def calculate_spectral_features(
+    spectrogram: Spectrogram,
+    bands: list[tuple[int, int]],
+    n_mfcc: int = DEFAULT_N_MFCC,
+) -> dict[str, float]:
+    """
+    Derives all segment-level spectral features from one spectrogram.
+
+    Per-frame features are averaged across frames.
+
+    Returns:
+        A mapping of feature names (``spectral_*``, ``mfcc_<n>`` and
+        ``relative_energy_band_<n>``) to scalar values.
+    """
+    result = {
+        "spectral_centroid": _frame_mean(spectral_centroid(spectrogram)),
+        "spectral_bandwidth": _frame_mean(spectral_bandwidth(spectrogram)),
+        "spectral_rolloff": _frame_mean(spectral_rolloff(spectrogram)),
+        "spectral_flatness": _frame_mean(spectral_flatness(spectrogram)),
+        "spectral_flux": _frame_mean(spectral_flux(spectrogram)),
+    }
+
+    coefficients = mfcc(spectrogram, n_mfcc)
+    means = coefficients.mean(axis=0) if coefficients.shape[0] else np.zeros(n_mfcc)
+    for index, value in enumerate(means, start=1):
+        result[f"mfcc_{index}"] = float(value)
+
+    for index, value in enumerate(band_relative_energy(spectrogram, bands), start=1):
+        result[f"relative_energy_band_{index}"] = float(value)
+
+    return result
@@ -0,0 +1,302 @@
+"""Incremental backfill of feature columns into an existing feature table."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src import main as pipeline
+from src.analysis import features, preprocessing
+from src.utils import audio_io
+
+MISSING = "missing"
+
+
+def _read_table(table_path: Path) -> pd.DataFrame:
+	"""Read a feature table stored as CSV or Parquet."""
+	if table_path.suffix.lower() == ".parquet":
+		return pd.read_parquet(table_path)
+	return pd.read_csv(table_path)
+
+
+def _write_table(df: pd.DataFrame, table_path: Path) -> None:
+	"""Replace the feature table atomically so an interrupted write never truncates it."""
+	fd, temporary = tempfile.mkstemp(dir=table_path.parent, suffix=table_path.suffix + ".tmp")
+	os.close(fd)
+	try:
+		if table_path.suffix.lower() == ".parquet":
+			df.to_parquet(temporary, index=False)
+		else:
+			df.to_csv(temporary, index=False)
+		os.replace(temporary, table_path)
+	except BaseException:
+		if os.path.exists(temporary):
+			os.remove(temporary)
+		raise
+
+
+def resolve_columns(
+	requested: Iterable[str],
+	config: pipeline.PipelineConfig,
+	existing_columns: Iterable[str] = (),
+) -> dict[str, list[str]]:
+	"""Map requested column or feature-group names to ``{group: [columns]}``.
+
+	``"missing"`` selects every feature column absent from ``existing_columns``.
+	"""
+	group_columns = pipeline._feature_group_columns(config)
+	column_groups = {column: group for group, columns in group_columns.items() for column in columns}
+	existing = set(existing_columns)
+
+	selected: dict[str, list[str]] = {}
+	for name in requested:
+		if name == MISSING:
+			candidates = [column for column in column_groups if column not in existing]
+		elif name in group_columns:
+			candidates = group_columns[name]
+		elif name in column_groups:
+			candidates = [name]
+		else:
+			raise ValueError(f"Unknown feature column or group: {name!r}")
+
+		for column in candidates:
+			columns = selected.setdefault(column_groups[column], [])
+			if column not in columns:
+				columns.append(column)
+	return selected
+
+
+def _check_run_config(table: Path, config: pipeline.PipelineConfig) -> None:
+	"""Refuse to merge columns computed with other feature settings than the table's run."""
+	run_config = pipeline._read_run_config(table.parent)
+	if run_config is None:
+		return
+	mismatched = [
+		f"{name}={getattr(config, name)!r} (table: {getattr(run_config, name)!r})"
+		for name in pipeline.FEATURE_FIELDS
+		if getattr(config, name) != getattr(run_config, name)
+	]
+	if mismatched:
+		raise ValueError(
+			f"Backfill config does not match the run that produced {table}: {', '.join(mismatched)}."
+		)
+
+
+def _load_segment(segment_path: Path, config: pipeline.PipelineConfig) -> np.ndarray:
+	"""Load an exported segment WAV as the pipeline's normalized segment signal."""
+	signal, sample_rate = audio_io.load_wav(str(segment_path))
+	signal = preprocessing.downsample_signal(signal, sample_rate, config.target_sample_rate)
+	return preprocessing.normalize_energy(signal)
+
+
+def _backfill_chunk(
+	segment_dir: Path,
+	segment_ids: list[str],
+	selected: dict[str, list[str]],
+	config: pipeline.PipelineConfig,
+) -> tuple[list[dict[str, float | str]], list[str]]:
+	"""Compute the selected columns for a chunk of segments; returns (records, missing IDs)."""
+	records = []
+	missing = []
+	wanted = [column for columns in selected.values() for column in columns]
+	for segment_id in segment_ids:
+		segment_path = segment_dir / f"{segment_id}.wav"
+		if not segment_path.exists():
+			missing.append(segment_id)
+			continue
+		segment_signal = _load_segment(segment_path, config)
+		record = pipeline._analyze_segment(segment_id, segment_signal, config, groups=selected)
+		records.append({"segment_id": segment_id, **{column: record[column] for column in wanted}})
+	return records, missing
+
+
+def _chunks(items: Sequence[str], size: int) -> Iterator[list[str]]:
+	for start in range(0, len(items), size):
+		yield list(items[start : start + size])
+
+
+def run_backfill(
+	columns: Sequence[str],
+	*,
+	table_path: str,
+	segments_dir: str | None = None,
+	config: pipeline.PipelineConfig | None = None,
+	workers: int = 1,
+	chunk_size: int = 64,
+	overwrite: bool = False,
+) -> pd.DataFrame:
+	"""Compute selected feature columns from exported segment WAVs and merge them in place.
+
+	Only the feature groups behind the requested columns are run, and only
+	for rows whose value is missing (absent column or NaN) unless
+	``overwrite`` is set. Chunks of segments run on ``workers`` processes and
+	their results are appended to a ``<table>.backfill.csv`` journal as they
+	finish; rerunning after an interruption skips the journaled segments. The
+	journal is merged into the table, which is rewritten atomically, and then
+	removed. Values are computed from the 16-bit segment WAVs, so they can
+	differ from a full run by quantization error.
+
+	When the table's folder holds the ``features_config.json`` written by
+	the pipeline, ``config`` defaults to that run's config and a config whose
+	feature settings (sample rate, framing, FFT size, MFCC count, vowel
+	backend) differ from it is rejected with ``ValueError``.
+	"""
+
+	table = Path(table_path)
+	if not table.exists():
+		raise FileNotFoundError(f"Feature table not found: {table}")
+	cfg = pipeline._validate_config(config or pipeline._read_run_config(table.parent) or pipeline.PipelineConfig())
+	_check_run_config(table, cfg)
+	segment_dir = Path(segments_dir) if segments_dir is not None else table.parent / "segments"
+	if not segment_dir.exists():
+		raise FileNotFoundError(f"Segment directory not found: {segment_dir}")
+
+	df = _read_table(table)
+	selected = resolve_columns(columns, cfg, df.columns)
+	target_columns = [column for group_columns in selected.values() for column in group_columns]
+	if not target_columns:
+		return df
+
+	journal_path = table.with_name(table.name + ".backfill.csv")
+	journal_columns = ["segment_id", *target_columns]
+	done = pd.DataFrame(columns=journal_columns)
+	if journal_path.exists():
+		done = pd.read_csv(journal_path)
+		if list(done.columns) != journal_columns:
+			journal_path.unlink()
+			done = pd.DataFrame(columns=journal_columns)
+
+	if overwrite:
+		needs_work = pd.Series(True, index=df.index)
+	else:
+		present = [column for column in target_columns if column in df.columns]
+		needs_work = pd.Series(len(present) < len(target_columns), index=df.index)
+		if present:
+			needs_work |= df[present].isna().any(axis=1)
+	done_ids = set(done["segment_id"].astype(str))
+	pending = [
+		segment_id
+		for segment_id in dict.fromkeys(df.loc[needs_work, "segment_id"].astype(str))
+		if segment_id not in done_ids
+	]
+
+	missing_segments: list[str] = []
+	header_needed = not journal_path.exists()
+
+	def _journal(records: list[dict[str, float | str]]) -> None:
+		nonlocal header_needed
+		if records:
+			pd.DataFrame(records, columns=journal_columns).to_csv(
+				journal_path, mode="w" if header_needed else "a", header=header_needed, index=False
+			)
+			header_needed = False
+
+	chunks = list(_chunks(pending, max(chunk_size, 1)))
+	if workers > 1 and len(chunks) > 1:
+		with ProcessPoolExecutor(max_workers=workers) as pool:
+			futures = [pool.submit(_backfill_chunk, segment_dir, chunk, selected, cfg) for chunk in chunks]
+			for future in as_completed(futures):
+				records, missing = future.result()
+				_journal(records)
+				missing_segments.extend(missing)
+	else:
+		for chunk in chunks:
+			records, missing = _backfill_chunk(segment_dir, chunk, selected, cfg)
+			_journal(records)
+			missing_segments.extend(missing)
+
+	if missing_segments:
+		print(
+			f"Skipped {len(missing_segments)} segment(s) without audio in {segment_dir}.",
+			file=sys.stderr,
+		)
+
+	if journal_path.exists():
+		results = pd.read_csv(journal_path).drop_duplicates("segment_id", keep="last")
+		results = results.set_index(results["segment_id"].astype(str))
+		segment_ids = df["segment_id"].astype(str)
+		rows = segment_ids.isin(results.index)
+		for column in target_columns:
+			if column not in df.columns:
+				df[column] = np.nan
+			if pd.api.types.is_numeric_dtype(df[column]) and not pd.api.types.is_numeric_dtype(results[column]):
+				df[column] = df[column].astype(object)
+			df.loc[rows, column] = segment_ids[rows].map(results[column])
+
+		_write_table(df, table)
+		journal_path.unlink()
+
+	return df
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	"""Create the CLI argument parser for backfill runs."""
+	parser = argparse.ArgumentParser(
+		description="Add feature columns to an existing feature table.",
+		epilog=(
+			"Feature settings default to the run's features_config.json next to the table "
+			"(or the pipeline defaults without one); settings that contradict it are rejected."
+		),
+	)
+	parser.add_argument(
+		"--backfill",
+		type=str,
+		required=True,
+		help="Comma-separated feature columns or groups (time, vowel, spectral), or 'missing'.",
+	)
+	parser.add_argument("--output-dir", type=str, default="results", help="Directory of a previous run.")
+	parser.add_argument(
+		"--table",
+		type=str,
+		help="Feature table to update (.csv or .parquet); defaults to <output-dir>/features.csv.",
+	)
+	parser.add_argument(
+		"--segments-dir",
+		type=str,
+		help="Directory with exported segment WAVs; defaults to the table's segments/ folder.",
+	)
+	parser.add_argument("--workers", type=int, default=1, help="Number of backfill processes.")
+	parser.add_argument("--overwrite", action="store_true", help="Recompute columns that already have values.")
+	parser.add_argument(
+		"--vowel-backend",
+		choices=features.VOWEL_BACKENDS,
+		help="Vowel feature backend used for F0/HNR/Jitter/Shimmer.",
+	)
+	parser.add_argument("--target-sample-rate", type=int, help="Sample rate segments are analyzed at.")
+	parser.add_argument("--frame-length", type=int, help="Frame length in samples for contour features.")
+	parser.add_argument("--hop-length", type=int, help="Hop length in samples for contours and spectrograms.")
+	parser.add_argument("--n-fft", type=int, help="FFT size of the spectrogram.")
+	parser.add_argument("--n-mfcc", type=int, help="Number of MFCC coefficients.")
+	return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+	"""Parse CLI arguments, run the backfill, and return an exit code."""
+	parser = _build_parser()
+	args = parser.parse_args(argv)
+
+	table_path = args.table or str(Path(args.output_dir) / "features.csv")
+	base = pipeline._read_run_config(Path(table_path).parent) or pipeline.PipelineConfig()
+	overrides = {name: getattr(args, name) for name in pipeline.FEATURE_FIELDS if getattr(args, name) is not None}
+	run_backfill(
+		[name.strip() for name in args.backfill.split(",") if name.strip()],
+		table_path=table_path,
+		segments_dir=args.segments_dir,
+		config=replace(base, **overrides),
+		workers=args.workers,
+		overwrite=args.overwrite,
+	)
+	return 0
+
+
+if __name__ == "__main__":
+	raise SystemExit(main(sys.argv[1:]))
@@ -3,17 +3,32 @@
 from __future__ import annotations
 
 import argparse
+import itertools
+import json
 import sys
-from dataclasses import dataclass
+import warnings
+from concurrent.futures import (
+	FIRST_COMPLETED,
+	Executor,
+	Future,
+	ProcessPoolExecutor,
+	ThreadPoolExecutor,
+	wait,
+)
+from dataclasses import asdict, dataclass, fields
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 import numpy as np
 import pandas as pd
 import parselmouth
 
 from src.analysis import features, preprocessing, spectral
-from src.utils import audio_io
+from src.analysis.signal_index import SignalIndex
+from src.utils import audio_io, discovery, duration_index
+from src.utils.progress import ProgressReporter
+from src.utils.signal_cache import DEFAULT_MAX_BYTES, SignalCache
 
 
 TARGET_SAMPLE_RATE = 16_000
@@ -21,6 +36,18 @@ FRAME_LENGTH = int(0.02 * TARGET_SAMPLE_RATE)  # 20 ms windows
 HOP_LENGTH = int(0.01 * TARGET_SAMPLE_RATE)  # 10 ms hop
 MIN_SEGMENT_DURATION = 0.1  # seconds
 ENERGY_THRESHOLD_RATIO = 0.1  # relative to peak energy
+SEGMENT_EXECUTORS = ("thread", "process")
+SEGMENTATION_MODES = ("single", "coarse")
+FEATURE_GROUPS = ("time", "vowel", "spectral")
+SIGNAL_INDEX_MIN_SEGMENTS = 8  # fewer segments are cheaper to measure directly
+SIGNAL_INDEX_MIN_COVERAGE = 0.5  # share of the signal the segments must span to pay for a whole-file index
+RUN_CONFIG_FILENAME = "features_config.json"  # PipelineConfig of the run, written next to features.csv
+
+# PipelineConfig fields that change the features of a given (start, end) segment of a
+# loaded signal. Segmentation-only fields (threshold ratio, minimum duration) are
+# deliberately absent: sweeps analyze identical segments found under different
+# thresholds once, and backfills only need these to match the original run.
+FEATURE_FIELDS = ("target_sample_rate", "frame_length", "hop_length", "n_fft", "n_mfcc", "vowel_backend")
 
 
 @dataclass
@@ -30,14 +57,35 @@ class PipelineConfig:
 	hop_length: int = HOP_LENGTH
 	min_segment_duration: float = MIN_SEGMENT_DURATION
 	energy_threshold_ratio: float = ENERGY_THRESHOLD_RATIO
-
-
-def _collect_audio_files(input_file: str | None, input_dir: str | None) -> list[Path]:
-	"""Resolve and validate the set of input WAV files to process."""
-	if input_file and input_dir:
-		raise ValueError("Specify either --input-file or --input-dir, not both.")
-	if not input_file and not input_dir:
-		raise ValueError("You must provide --input-file or --input-dir.")
+	n_fft: int = spectral.DEFAULT_N_FFT
+	n_mfcc: int = spectral.DEFAULT_N_MFCC
+	vowel_backend: str = "praat"
+	segment_workers: int = 1
+	segment_executor: str = "thread"
+	file_workers: int = 1
+	signal_cache_dir: str | None = None
+	signal_cache_max_bytes: int = DEFAULT_MAX_BYTES
+	segmentation: str = "single"
+
+
+def _collect_audio_files(
+	input_file: str | None,
+	input_dir: str | None,
+	file_list: str | None = None,
+	*,
+	sort_inputs: bool = False,
+) -> Iterable[Path]:
+	"""Resolve and validate the set of input WAV files to process.
+
+	Directory and manifest inputs are streamed so processing can begin before
+	discovery finishes; ``sort_inputs`` opts into a deterministic, sorted
+	order at the cost of completing the scan first.
+	"""
+	provided = [value for value in (input_file, input_dir, file_list) if value]
+	if len(provided) > 1:
+		raise ValueError("Specify only one of --input-file, --input-dir or --file-list.")
+	if not provided:
+		raise ValueError("You must provide --input-file, --input-dir or --file-list.")
 
 	if input_file:
 		file_path = Path(input_file)
@@ -45,163 +93,787 @@ def _collect_audio_files(input_file: str | None, input_dir: str | None) -> list[
 			raise FileNotFoundError(f"Input file not found: {file_path}")
 		return [file_path]
 
-	directory = Path(input_dir)  # type: ignore[arg-type]
-	if not directory.exists():
-		raise FileNotFoundError(f"Input directory not found: {directory}")
-
-	return sorted(p for p in directory.glob("**/*.wav") if p.is_file())
+	paths: Iterable[Path]
+	if file_list:
+		manifest_path = Path(file_list)
+		if not manifest_path.exists():
+			raise FileNotFoundError(f"File list not found: {manifest_path}")
+		paths = (entry.path for entry in discovery.read_file_list(manifest_path))
+	else:
+		directory = Path(input_dir)  # type: ignore[arg-type]
+		if not directory.exists():
+			raise FileNotFoundError(f"Input directory not found: {directory}")
+		paths = discovery.iter_wav_files(directory)
 
+	return sorted(paths) if sort_inputs else paths
 
-def _analyze_segment(
-	segment_id: str,
-	segment_signal: np.ndarray,
-	config: PipelineConfig,
-) -> dict[str, float | str]:
-	"""Calculate all configured features for a normalized segment."""
-	length_seconds = features.calculate_length(segment_signal, config.target_sample_rate)
-	rms_energy = features.calculate_rms_energy(segment_signal)
-	zcr = features.calculate_zcr(segment_signal)
 
-	amplitude_contour = features.calculate_amplitude_contour(
-		segment_signal, config.frame_length, config.hop_length
-	)
-	normalized_contour = features.normalize_contour(amplitude_contour)
-	amplitude_mean = float(np.mean(amplitude_contour)) if amplitude_contour.size else 0.0
-	contour_slope = features.calculate_amplitude_contour_slope(normalized_contour)
-	contour_curvature = features.calculate_amplitude_contour_curvature(normalized_contour)
-	contour_entropy = features.calculate_sample_entropy(normalized_contour)
-	contour_kurtosis = features.calculate_kurtosis(normalized_contour)
-	crest_factor = features.calculate_crest_factor(segment_signal)
-	crest_position = features.calculate_crest_factor_position(normalized_contour)
-	normalized_contour_str = " ".join(f"{value:.6f}" for value in normalized_contour)
-
-	band_limits = [
+def _band_limits(config: PipelineConfig) -> list[tuple[int, int]]:
+	"""Frequency bands used for the relative energy features."""
+	return [
 		(0, 400),
 		(400, 800),
 		(800, 1_600),
 		(1_600, 3_200),
 		(3_200, config.target_sample_rate // 2),
 	]
-	relative_energy = spectral.calculate_relative_energy(
-		segment_signal, config.target_sample_rate, band_limits
-	)
 
-	praat_sound = parselmouth.Sound(segment_signal, sampling_frequency=config.target_sample_rate)
-	vowel_features = features.analyze_vowel(praat_sound, config.target_sample_rate)
 
-	record: dict[str, float | str] = {
-		"segment_id": segment_id,
-		"length": length_seconds,
-		"rms_energy": float(rms_energy),
-		"zcr": float(zcr),
+def _segment_statistics(
+	segment_signal: np.ndarray,
+	config: PipelineConfig,
+) -> dict[str, float | np.ndarray]:
+	"""Scalar statistics and amplitude contour computed directly from a normalized segment."""
+	return {
+		"rms_energy": float(features.calculate_rms_energy(segment_signal)),
+		"zcr": float(features.calculate_zcr(segment_signal)),
+		"crest_factor": features.calculate_crest_factor(segment_signal),
+		"amplitude_contour": features.calculate_amplitude_contour(
+			segment_signal, config.frame_length, config.hop_length
+		),
+	}
+
+
+def _indexed_segment_statistics(
+	index: SignalIndex,
+	start: int,
+	end: int,
+	config: PipelineConfig,
+) -> dict[str, float | np.ndarray]:
+	"""The same statistics as ``_segment_statistics``, answered from a file-level index."""
+	return {
+		"rms_energy": index.rms(start, end),
+		"zcr": index.zcr(start, end),
+		"crest_factor": index.crest_factor(start, end),
+		"amplitude_contour": index.amplitude_contour(start, end, config.frame_length, config.hop_length),
+	}
+
+
+def _time_features(
+	segment_signal: np.ndarray,
+	config: PipelineConfig,
+	statistics: dict[str, float | np.ndarray] | None = None,
+) -> dict[str, float | str]:
+	"""Length, energy and amplitude-contour features of a normalized segment."""
+	if statistics is None:
+		statistics = _segment_statistics(segment_signal, config)
+
+	amplitude_contour = statistics["amplitude_contour"]
+	normalized_contour = features.normalize_contour(amplitude_contour)
+	amplitude_mean = float(np.mean(amplitude_contour)) if amplitude_contour.size else 0.0
+
+	return {
+		"length": features.calculate_length(segment_signal, config.target_sample_rate),
+		"rms_energy": float(statistics["rms_energy"]),
+		"zcr": float(statistics["zcr"]),
 		"amplitude_mean": amplitude_mean,
-		"amplitude_contour": normalized_contour_str,
-		"amplitude_contour_slope": contour_slope,
-		"amplitude_contour_curvature": contour_curvature,
-		"sample_entropy_contour": contour_entropy,
-		"kurtosis_contour": contour_kurtosis,
-		"crest_factor": crest_factor,
-		"crest_factor_position": crest_position,
-		"F0": vowel_features.get("F0", 0.0),
-		"HNR": vowel_features.get("HNR", 0.0),
-		"Jitter": vowel_features.get("Jitter", 0.0),
-		"Shimmer": vowel_features.get("Shimmer", 0.0),
+		"amplitude_contour": " ".join(f"{value:.6f}" for value in normalized_contour),
+		"amplitude_contour_slope": features.calculate_amplitude_contour_slope(normalized_contour),
+		"amplitude_contour_curvature": features.calculate_amplitude_contour_curvature(normalized_contour),
+		"sample_entropy_contour": features.calculate_sample_entropy(normalized_contour),
+		"kurtosis_contour": features.calculate_kurtosis(normalized_contour),
+		"crest_factor": float(statistics["crest_factor"]),
+		"crest_factor_position": features.calculate_crest_factor_position(normalized_contour),
 	}
 
-	for idx, value in enumerate(relative_energy, start=1):
-		record[f"relative_energy_band_{idx}"] = float(value)
 
-	return record
+def _vowel_group_features(
+	segment_signal: np.ndarray,
+	config: PipelineConfig,
+	vowel_features: dict[str, float] | None = None,
+) -> dict[str, float | str]:
+	"""F0, HNR, jitter and shimmer from the configured vowel backend."""
+	if vowel_features is None:
+		if config.vowel_backend == "fast":
+			vowel_features = features.analyze_vowel_fast(segment_signal, config.target_sample_rate)
+		else:
+			praat_sound = parselmouth.Sound(segment_signal, sampling_frequency=config.target_sample_rate)
+			vowel_features = features.analyze_vowel(praat_sound, config.target_sample_rate)
 
+	return {name: vowel_features.get(name, 0.0) for name in ("F0", "HNR", "Jitter", "Shimmer")}
 
-def _process_file(
-	audio_path: Path,
-	output_dir: Path,
+
+def _spectral_group_features(
+	segment_signal: np.ndarray,
 	config: PipelineConfig,
-) -> Iterable[dict[str, float | str]]:
-	"""Process a single input file and yield feature records for each segment."""
+	spectrogram: spectral.Spectrogram | None = None,
+) -> dict[str, float | str]:
+	"""All spectrogram-derived features, including relative band energies."""
+	if spectrogram is None:
+		spectrogram = spectral.compute_spectrogram(
+			segment_signal, config.target_sample_rate, config.n_fft, config.hop_length
+		)
+	return spectral.calculate_spectral_features(spectrogram, _band_limits(config), config.n_mfcc)
+
+
+def _feature_group_columns(config: PipelineConfig) -> dict[str, list[str]]:
+	"""Output columns produced by each feature group, in record order."""
+	return {
+		"time": [
+			"length",
+			"rms_energy",
+			"zcr",
+			"amplitude_mean",
+			"amplitude_contour",
+			"amplitude_contour_slope",
+			"amplitude_contour_curvature",
+			"sample_entropy_contour",
+			"kurtosis_contour",
+			"crest_factor",
+			"crest_factor_position",
+		],
+		"vowel": ["F0", "HNR", "Jitter", "Shimmer"],
+		"spectral": [
+			"spectral_centroid",
+			"spectral_bandwidth",
+			"spectral_rolloff",
+			"spectral_flatness",
+			"spectral_flux",
+			*(f"mfcc_{index}" for index in range(1, config.n_mfcc + 1)),
+			*(f"relative_energy_band_{index}" for index in range(1, len(_band_limits(config)) + 1)),
+		],
+	}
+
+
+def _output_columns(config: PipelineConfig) -> list[str]:
+	"""Columns of a feature table for ``config``, in the order records carry them."""
+	return ["segment_id", *itertools.chain.from_iterable(_feature_group_columns(config).values()), "source_file"]
+
+
+def _analyze_segment(
+	segment_id: str,
+	segment_signal: np.ndarray,
+	config: PipelineConfig,
+	spectrogram: spectral.Spectrogram | None = None,
+	vowel_features: dict[str, float] | None = None,
+	statistics: dict[str, float | np.ndarray] | None = None,
+	groups: Iterable[str] = FEATURE_GROUPS,
+) -> dict[str, float | str]:
+	"""Calculate the requested feature groups for a normalized segment.
+
+	A precomputed ``spectrogram``, ``vowel_features`` or ``statistics``
+	(e.g. from a per-file batch or ``SignalIndex``) is reused; otherwise it is
+	computed for the segment alone. ``groups`` selects a subset of
+	``FEATURE_GROUPS`` so callers can compute individual features only.
+	"""
+	selected = set(groups)
+	record: dict[str, float | str] = {"segment_id": segment_id}
+	if "time" in selected:
+		record.update(_time_features(segment_signal, config, statistics))
+	if "vowel" in selected:
+		record.update(_vowel_group_features(segment_signal, config, vowel_features))
+	if "spectral" in selected:
+		record.update(_spectral_group_features(segment_signal, config, spectrogram))
+	return record
+
+
+def _prepare_signal(signal: np.ndarray, original_rate: int, target_sample_rate: int) -> np.ndarray:
+	"""Resample and peak-normalize a decoded signal."""
+	signal = preprocessing.downsample_signal(signal, original_rate, target_sample_rate)
+	return preprocessing.normalize_energy(signal)
+
+
+def _decode_signal(audio_path: Path, target_sample_rate: int) -> np.ndarray:
+	"""Decode, resample and peak-normalize one input file."""
 	signal, original_rate = audio_io.load_wav(str(audio_path))
-	signal = preprocessing.downsample_signal(signal, original_rate, config.target_sample_rate)
-	signal = preprocessing.normalize_energy(signal)
+	return _prepare_signal(signal, original_rate, target_sample_rate)
+
+
+def _load_signal(audio_path: Path, config: PipelineConfig) -> np.ndarray:
+	"""Return the analysis-ready signal, through the persistent signal cache when configured."""
+	if config.signal_cache_dir is None:
+		return _decode_signal(audio_path, config.target_sample_rate)
 
-	frame_length = config.frame_length
-	hop_length = config.hop_length
+	cache = SignalCache(config.signal_cache_dir, config.signal_cache_max_bytes)
+	return cache.load_signal(audio_path, config.target_sample_rate, _decode_signal)
 
+
+def _detect_segments(
+	signal: np.ndarray,
+	config: PipelineConfig,
+	frame_energy: np.ndarray | None = None,
+) -> list[tuple[int, int]]:
+	"""Energy-based segmentation, falling back to the whole signal when nothing is active.
+
+	``frame_energy`` may be supplied when it was already computed for the same
+	``frame_length``/``hop_length``. Otherwise ``config.segmentation == "coarse"``
+	prunes provably silent frames before framing; the boundaries are identical.
+	"""
 	dynamic_threshold = config.energy_threshold_ratio * float(np.max(np.abs(signal)) or 1.0)
-	segments = preprocessing.segment_by_energy(
-		signal,
+	if frame_energy is None:
+		if config.segmentation == "coarse":
+			frame_energy = preprocessing.calculate_frame_energy_coarse_to_fine(
+				signal, config.frame_length, config.hop_length, dynamic_threshold
+			)
+		else:
+			frame_energy = preprocessing.calculate_frame_energy(signal, config.frame_length, config.hop_length)
+
+	segments = preprocessing.segments_from_energy(
+		frame_energy,
+		len(signal),
 		config.target_sample_rate,
-		frame_length,
-		hop_length,
+		config.hop_length,
 		dynamic_threshold,
 		config.min_segment_duration,
 	)
-	if not segments:
-		segments = [(0, len(signal))]
+	return segments or [(0, len(signal))]
+
+
+def _analyze_segment_batch(
+	signal: np.ndarray | None,
+	segments: list[tuple[int, int]],
+	segment_ids: list[str],
+	config: PipelineConfig,
+	statistics: list[dict[str, float | np.ndarray] | None],
+	segment_signals: list[np.ndarray] | None = None,
+) -> list[dict[str, float | str]]:
+	"""Analyze a run of segments of one signal with a batched STFT and fast-vowel pass.
+
+	Normalized ``segment_signals`` are reused when already available, in
+	which case ``signal`` is not read.
+	"""
+	if segment_signals is None:
+		segment_signals = [preprocessing.normalize_energy(signal[start:end]) for start, end in segments]
+	spectrograms = spectral.compute_spectrograms(
+		segment_signals, config.target_sample_rate, config.n_fft, config.hop_length
+	)
+	vowel_results: list[dict[str, float] | None] = [None] * len(segment_signals)
+	if config.vowel_backend == "fast":
+		vowel_results = list(features.analyze_vowels_fast(segment_signals, config.target_sample_rate))
+	return [
+		_analyze_segment(segment_id, segment_signal, config, spectrogram, vowel_features, segment_statistics)
+		for segment_id, segment_signal, spectrogram, vowel_features, segment_statistics in zip(
+			segment_ids, segment_signals, spectrograms, vowel_results, statistics
+		)
+	]
+
 
-	segment_dir = output_dir / "segments"
-	segment_dir.mkdir(parents=True, exist_ok=True)
+def _analyze_shared_segment_batch(
+	shm_name: str,
+	signal_length: int,
+	dtype: str,
+	segments: list[tuple[int, int]],
+	segment_ids: list[str],
+	config: PipelineConfig,
+	statistics: list[dict[str, float | np.ndarray] | None],
+) -> list[dict[str, float | str]]:
+	"""Process-pool job: analyze a run of segments of a signal held in shared memory."""
+	shared = shared_memory.SharedMemory(name=shm_name)
+	try:
+		signal = np.ndarray((signal_length,), dtype=dtype, buffer=shared.buf)
+		segment_signals = [preprocessing.normalize_energy(np.array(signal[start:end])) for start, end in segments]
+		del signal
+	finally:
+		shared.close()
+	return _analyze_segment_batch(None, segments, segment_ids, config, statistics, segment_signals)
+
+
+def _segment_batches(n_segments: int, config: PipelineConfig) -> list[slice]:
+	"""Split segment positions into contiguous runs, two per worker, for the segment pool."""
+	n_batches = max(min(n_segments, 2 * config.segment_workers), 1)
+	bounds = np.linspace(0, n_segments, n_batches + 1).astype(int)
+	return [slice(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+
+
+def _create_segment_executor(config: PipelineConfig) -> Executor | None:
+	"""Build the pool used for intra-file segment parallelism, if enabled."""
+	if config.segment_workers <= 1:
+		return None
+	if config.segment_executor == "process":
+		return ProcessPoolExecutor(max_workers=config.segment_workers)
+	return ThreadPoolExecutor(max_workers=config.segment_workers)
+
+
+def _iter_file_records(
+	audio_path: Path,
+	config: PipelineConfig,
+	segment_dir: Path | None = None,
+	executor: Executor | None = None,
+) -> Iterator[dict[str, float | str]]:
+	"""Lazily yield feature records for each segment of a single input file.
 
-	records: list[dict[str, float | str]] = []
-	for index, (start, end) in enumerate(segments, start=1):
-		segment_signal = preprocessing.normalize_energy(signal[start:end])
-		segment_id = f"{audio_path.stem}_{index:02d}"
+	Segment WAVs are written to ``segment_dir`` when provided; otherwise no
+	files are touched.
+	"""
+	signal = _load_signal(audio_path, config)
+	yield from _iter_signal_records(signal, audio_path.name, config, segment_dir, executor)
 
-		segment_path = segment_dir / f"{segment_id}.wav"
-		audio_io.save_wav(str(segment_path), segment_signal, config.target_sample_rate)
 
-		record = _analyze_segment(segment_id, segment_signal, config)
-		record["source_file"] = audio_path.name
-		records.append(record)
+def _iter_signal_records(
+	signal: np.ndarray,
+	source_name: str,
+	config: PipelineConfig,
+	segment_dir: Path | None = None,
+	executor: Executor | None = None,
+	segment_signals_out: list[np.ndarray] | None = None,
+) -> Iterator[dict[str, float | str]]:
+	"""Lazily yield feature records for each segment of a prepared signal.
+
+	Segment IDs are derived from the stem of ``source_name``. The normalized
+	segment signals are appended to ``segment_signals_out`` when given.
+	"""
+	segments = _detect_segments(signal, config)
+
+	if segment_dir is not None:
+		segment_dir.mkdir(parents=True, exist_ok=True)
+
+	stem = Path(source_name).stem
+	segment_ids = [f"{stem}_{index:02d}" for index in range(1, len(segments) + 1)]
+	segment_signals: list[np.ndarray] | None = None
+	if segment_dir is not None or segment_signals_out is not None:
+		segment_signals = [preprocessing.normalize_energy(signal[start:end]) for start, end in segments]
+	if segment_signals_out is not None:
+		segment_signals_out.extend(segment_signals)
+
+	if segment_dir is not None:
+		for segment_id, segment_signal in zip(segment_ids, segment_signals):
+			segment_path = segment_dir / f"{segment_id}.wav"
+			audio_io.save_wav(str(segment_path), segment_signal, config.target_sample_rate)
+
+	records = _iter_segment_records(
+		signal,
+		segments,
+		segment_ids,
+		config,
+		executor,
+		_batch_statistics(signal, segments, config),
+		segment_signals,
+	)
+	for record in records:
+		record["source_file"] = source_name
+		yield record
+
 
-	return records
+def _use_signal_index(signal_length: int, segments: list[tuple[int, int]]) -> bool:
+	"""Whether a whole-file ``SignalIndex`` is cheaper than measuring each segment directly.
+
+	The index costs O(signal length) to build while direct statistics cost
+	O(total segment length), so it only pays off for many segments that
+	together span a large share of the signal.
+	"""
+	if len(segments) < SIGNAL_INDEX_MIN_SEGMENTS:
+		return False
+	covered = sum(end - start for start, end in segments)
+	return covered >= SIGNAL_INDEX_MIN_COVERAGE * signal_length
+
+
+def _batch_statistics(
+	signal: np.ndarray,
+	segments: list[tuple[int, int]],
+	config: PipelineConfig,
+	signal_index: SignalIndex | None = None,
+) -> list[dict[str, float | np.ndarray] | None]:
+	"""Per-segment statistics from a ``SignalIndex``, or ``None`` entries to measure segments directly.
+
+	An index is built only when ``_use_signal_index`` expects it to be
+	cheaper than direct measurement, unless one is passed in.
+	"""
+	if signal_index is None:
+		if not _use_signal_index(len(signal), segments):
+			return [None] * len(segments)
+		signal_index = SignalIndex(signal)
+	return [_indexed_segment_statistics(signal_index, start, end, config) for start, end in segments]
+
+
+def _iter_segment_records(
+	signal: np.ndarray,
+	segments: list[tuple[int, int]],
+	segment_ids: list[str],
+	config: PipelineConfig,
+	executor: Executor | None = None,
+	statistics: list[dict[str, float | np.ndarray] | None] | None = None,
+	segment_signals: list[np.ndarray] | None = None,
+) -> Iterator[dict[str, float | str]]:
+	"""Analyze given segments of a prepared signal and yield their records in segment order.
+
+	This is the shared "signal + segments -> records" step of the file
+	pipeline, the in-memory API and sweeps. ``statistics`` (from
+	``_batch_statistics``) and already normalized ``segment_signals`` are
+	reused when given. With an ``executor`` the segments are split into
+	contiguous runs, two per worker, and each run's normalization, batched
+	STFT, fast-vowel pass and per-segment features execute on a worker;
+	segmentation and the ``SignalIndex`` statistics stay in the caller.
+	Process workers read their segments from a shared-memory copy of the
+	signal instead of pickled arrays.
+	"""
+	if statistics is None:
+		statistics = [None] * len(segments)
+	if executor is None or not segments:
+		yield from _analyze_segment_batch(signal, segments, segment_ids, config, statistics, segment_signals)
+		return
+
+	batches = _segment_batches(len(segments), config)
+	shared: shared_memory.SharedMemory | None = None
+	try:
+		if isinstance(executor, ProcessPoolExecutor):
+			shared_signal = np.ascontiguousarray(signal)
+			shared = shared_memory.SharedMemory(create=True, size=max(shared_signal.nbytes, 1))
+			np.ndarray(shared_signal.shape, dtype=shared_signal.dtype, buffer=shared.buf)[:] = shared_signal
+			results = executor.map(
+				_analyze_shared_segment_batch,
+				[shared.name] * len(batches),
+				[len(shared_signal)] * len(batches),
+				[shared_signal.dtype.str] * len(batches),
+				[segments[batch] for batch in batches],
+				[segment_ids[batch] for batch in batches],
+				[config] * len(batches),
+				[statistics[batch] for batch in batches],
+			)
+		else:
+			results = executor.map(
+				_analyze_segment_batch,
+				[signal] * len(batches),
+				[segments[batch] for batch in batches],
+				[segment_ids[batch] for batch in batches],
+				[config] * len(batches),
+				[statistics[batch] for batch in batches],
+				[segment_signals[batch] if segment_signals is not None else None for batch in batches],
+			)
+
+		for records in results:
+			yield from records
+	finally:
+		if shared is not None:
+			shared.close()
+			shared.unlink()
+
+
+def _collect_file_records(
+	audio_path: Path,
+	config: PipelineConfig,
+	segment_dir: Path | None,
+) -> list[dict[str, float | str]]:
+	"""File-pool job: analyze one input file sequentially and return its records."""
+	return list(_iter_file_records(audio_path, config, segment_dir))
+
+
+def _iter_parallel_file_records(
+	audio_paths: Iterable[Path],
+	config: PipelineConfig,
+	segment_dir: Path | None,
+	durations: dict[Path, float] | None,
+	ordered: bool,
+) -> Iterator[tuple[Path, list[dict[str, float | str]]]]:
+	"""Analyze files on a process pool and yield ``(path, records)`` per file.
+
+	With ``durations`` files are submitted longest-first so the largest
+	recordings never start last. At most ``2 * file_workers`` files are in
+	flight, topped up as each finishes, so only their records are held in
+	memory. Results come back in completion order, or in input order when
+	``ordered`` is set, in which case only results that finished early are
+	buffered.
+	"""
+	if durations is not None:
+		audio_paths = list(audio_paths)
+		position_durations = {
+			position: durations[path] for position, path in enumerate(audio_paths) if path in durations
+		}
+		positions = duration_index.schedule_longest_first(list(range(len(audio_paths))), position_durations)
+		submissions: Iterator[tuple[int, Path]] = ((position, audio_paths[position]) for position in positions)
+	else:
+		submissions = enumerate(audio_paths)
+
+	window = 2 * config.file_workers
+	pool = ProcessPoolExecutor(max_workers=config.file_workers)
+	try:
+		in_flight: dict[Future, tuple[int, Path]] = {}
+		early: dict[int, tuple[Path, list[dict[str, float | str]]]] = {}
+		next_position = 0
+		exhausted = False
+		while True:
+			while not exhausted and len(in_flight) < window:
+				item = next(submissions, None)
+				if item is None:
+					exhausted = True
+					break
+				position, audio_path = item
+				in_flight[pool.submit(_collect_file_records, audio_path, config, segment_dir)] = item
+			if not in_flight:
+				break
+
+			done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+			for future in done:
+				position, audio_path = in_flight.pop(future)
+				records = future.result()
+				if ordered:
+					early[position] = (audio_path, records)
+				else:
+					yield audio_path, records
+			while next_position in early:
+				yield early.pop(next_position)
+				next_position += 1
+	finally:
+		pool.shutdown(cancel_futures=True)
+
+
+def _process_file(
+	audio_path: Path,
+	output_dir: Path,
+	config: PipelineConfig,
+) -> Iterable[dict[str, float | str]]:
+	"""Process a single input file and return feature records for each segment."""
+	return list(_iter_file_records(audio_path, config, output_dir / "segments"))
+
+
+def _validate_config(config: PipelineConfig) -> PipelineConfig:
+	"""Reject unknown backend, executor and segmentation names and unsupported MFCC counts up front."""
+	if config.vowel_backend not in features.VOWEL_BACKENDS:
+		raise ValueError(
+			f"Unknown vowel backend {config.vowel_backend!r}; expected one of {', '.join(features.VOWEL_BACKENDS)}."
+		)
+	if config.segment_executor not in SEGMENT_EXECUTORS:
+		raise ValueError(
+			f"Unknown segment executor {config.segment_executor!r}; expected one of {', '.join(SEGMENT_EXECUTORS)}."
+		)
+	if config.n_mfcc > spectral.DEFAULT_N_MELS:
+		raise ValueError(
+			f"n_mfcc={config.n_mfcc} exceeds the {spectral.DEFAULT_N_MELS} mel bands MFCCs are computed from."
+		)
+	if config.segmentation not in SEGMENTATION_MODES:
+		raise ValueError(
+			f"Unknown segmentation mode {config.segmentation!r}; expected one of {', '.join(SEGMENTATION_MODES)}."
+		)
+	return config
+
+
+def _write_run_config(output_path: Path, config: PipelineConfig) -> None:
+	"""Record the run's config next to ``features.csv`` so later tools can match its settings."""
+	(output_path / RUN_CONFIG_FILENAME).write_text(json.dumps(asdict(config), indent=2), encoding="utf-8")
+
+
+def _read_run_config(output_path: Path) -> PipelineConfig | None:
+	"""Config recorded by a previous run in ``output_path``, or ``None`` if it wrote none."""
+	config_path = output_path / RUN_CONFIG_FILENAME
+	if not config_path.exists():
+		return None
+	known = {field.name for field in fields(PipelineConfig)}
+	values = json.loads(config_path.read_text(encoding="utf-8"))
+	return PipelineConfig(**{name: value for name, value in values.items() if name in known})
+
+
+def analyze_signal(
+	signal: np.ndarray,
+	sample_rate: int,
+	config: PipelineConfig | None = None,
+	*,
+	name: str = "signal",
+	return_segments: bool = False,
+) -> list[dict[str, float | str]] | tuple[list[dict[str, float | str]], list[np.ndarray]]:
+	"""Analyze an in-memory mono signal without touching the filesystem.
+
+	Resampling, segmentation and feature extraction run on the array
+	directly; ``config.signal_cache_dir`` is ignored. ``name`` plays the role
+	of the file name: it fills ``source_file`` and its stem prefixes the
+	segment IDs, so ``name="x.wav"`` yields the same records as running the
+	pipeline on ``x.wav``. With ``return_segments`` the normalized segment
+	signals that would have been written as WAVs are returned alongside the
+	records.
+	"""
+	return analyze_signals([signal], sample_rate, config, names=[name], return_segments=return_segments)[0]
+
+
+def analyze_signals(
+	signals: Iterable[np.ndarray],
+	sample_rate: int | Iterable[int],
+	config: PipelineConfig | None = None,
+	*,
+	names: Iterable[str] | None = None,
+	return_segments: bool = False,
+) -> list[list[dict[str, float | str]]] | list[tuple[list[dict[str, float | str]], list[np.ndarray]]]:
+	"""Batch form of ``analyze_signal``: one result per input signal, in input order.
+
+	``sample_rate`` is a scalar (Python or NumPy integer) shared by all
+	signals or a sequence with one rate per signal, and ``names`` defaults
+	to ``signal_001``, ``signal_002``, ... A segment pool configured through
+	``segment_workers`` is created once for the batch.
+	"""
+	cfg = _validate_config(config or PipelineConfig())
+	signals = list(signals)
+	if isinstance(sample_rate, Iterable) and not isinstance(sample_rate, np.ndarray):
+		sample_rate = list(sample_rate)  # generators are 0-d to ``np.ndim``
+	rates = [int(sample_rate)] * len(signals) if np.ndim(sample_rate) == 0 else [int(rate) for rate in sample_rate]
+	labels = list(names) if names is not None else [f"signal_{index:03d}" for index in range(1, len(signals) + 1)]
+	if not len(rates) == len(labels) == len(signals):
+		raise ValueError("sample_rate and names must provide one entry per signal.")
+
+	results = []
+	executor = _create_segment_executor(cfg)
+	try:
+		for signal, rate, label in zip(signals, rates, labels):
+			signal = np.asarray(signal, dtype=float)
+			if signal.ndim != 1:
+				raise ValueError(f"Expected a mono 1-D signal for {label!r}, got shape {signal.shape}.")
+			prepared = _prepare_signal(signal, rate, cfg.target_sample_rate)
+			segment_signals: list[np.ndarray] = []
+			records = list(
+				_iter_signal_records(prepared, label, cfg, executor=executor, segment_signals_out=segment_signals)
+			)
+			results.append((records, segment_signals) if return_segments else records)
+	finally:
+		if executor is not None:
+			executor.shutdown()
+	return results
+
+
+def iter_features(
+	*,
+	input_file: str | None = None,
+	input_dir: str | None = None,
+	file_list: str | None = None,
+	output_dir: str | None = None,
+	config: PipelineConfig | None = None,
+	sort_inputs: bool = False,
+	save_segments: bool = False,
+	write_csv: bool = False,
+	batch_by_file: bool = False,
+	longest_first: bool = False,
+	duration_index_path: str | None = None,
+	progress: bool = False,
+) -> Iterator[dict[str, float | str]] | Iterator[list[dict[str, float | str]]]:
+	"""Lazily yield feature records as input files are processed.
+
+	By default this has no filesystem side effects, so library consumers can
+	stream records into their own storage with memory bounded by a single
+	file. ``save_segments`` writes normalized segment WAVs to
+	``<output_dir>/segments`` and ``write_csv`` appends each file's rows to
+	``<output_dir>/features.csv`` as they are produced, alongside the run's
+	config in ``<output_dir>/features_config.json``. With
+	``batch_by_file`` the generator yields one list of records per input
+	file instead of individual records. Inputs are streamed in discovery
+	order unless ``sort_inputs`` is set.
+
+	``progress``, ``duration_index_path`` and ``longest_first`` (which only
+	applies with ``config.file_workers > 1`` and is otherwise ignored with a
+	warning) run a header-only duration pre-pass, cached at
+	``duration_index_path`` when given. With ``config.file_workers > 1``
+	files are analyzed on a process pool, longest-first when requested, and
+	yielded as they finish unless ``sort_inputs`` asks for input order;
+	segment pools are not used inside file workers.
+	"""
+
+	cfg = _validate_config(config or PipelineConfig())
+	if (save_segments or write_csv) and output_dir is None:
+		raise ValueError("output_dir is required when save_segments or write_csv is enabled.")
+
+	audio_paths = _collect_audio_files(input_file, input_dir, file_list, sort_inputs=sort_inputs)
+	output_path = Path(output_dir) if output_dir is not None else None
+	if output_path is not None and (save_segments or write_csv):
+		output_path.mkdir(parents=True, exist_ok=True)
+
+	segment_dir = output_path / "segments" if save_segments and output_path is not None else None
+	output_csv = output_path / "features.csv" if write_csv and output_path is not None else None
+	if output_csv is not None:
+		_write_run_config(output_path, cfg)
+	header_written = False
+
+	schedule_longest_first = longest_first and cfg.file_workers > 1
+	if longest_first and not schedule_longest_first:
+		warnings.warn("longest_first only affects file_workers > 1; ignoring it.", stacklevel=2)
+
+	durations: dict[Path, float] | None = None
+	reporter: ProgressReporter | None = None
+	if schedule_longest_first or progress or duration_index_path is not None:
+		audio_paths = list(audio_paths)
+		known_durations = {}
+		if file_list:
+			known_durations = {
+				entry.path: entry.duration
+				for entry in discovery.read_file_list(file_list)
+				if entry.duration is not None
+			}
+		durations = duration_index.build_duration_index(audio_paths, duration_index_path, known_durations)
+		if progress:
+			reporter = ProgressReporter(len(audio_paths), sum(durations.values()))
+
+	executor = None
+	if cfg.file_workers > 1:
+		file_results: Iterable[tuple[Path, Iterable[dict[str, float | str]]]] = _iter_parallel_file_records(
+			audio_paths,
+			cfg,
+			segment_dir,
+			durations if schedule_longest_first else None,
+			ordered=sort_inputs,
+		)
+	else:
+		executor = _create_segment_executor(cfg)
+		file_results = (
+			(audio_path, _iter_file_records(audio_path, cfg, segment_dir, executor))
+			for audio_path in audio_paths
+		)
+
+	try:
+		for audio_path, records in file_results:
+			if not batch_by_file and output_csv is None:
+				yield from records
+			else:
+				batch = list(records)
+				if output_csv is not None and batch:
+					pd.DataFrame(batch).to_csv(
+						output_csv,
+						mode="a" if header_written else "w",
+						header=not header_written,
+						index=False,
+					)
+					header_written = True
+
+				if batch_by_file:
+					yield batch
+				else:
+					yield from batch
+
+			if reporter is not None and durations is not None:
+				reporter.update(durations.get(audio_path, 0.0), audio_path.name)
+	finally:
+		if executor is not None:
+			executor.shutdown()
 
 
 def run_pipeline(
 	*,
 	input_file: str | None = None,
 	input_dir: str | None = None,
+	file_list: str | None = None,
 	output_dir: str = "results",
 	config: PipelineConfig | None = None,
+	sort_inputs: bool = False,
+	longest_first: bool = False,
+	duration_index_path: str | None = None,
+	progress: bool = False,
 ) -> pd.DataFrame:
-	"""Execute the cough analysis pipeline and return the feature table."""
+	"""Execute the cough analysis pipeline and return the feature table.
+
+	``features.csv`` is written to ``output_dir`` together with
+	``features_config.json``, the config of the run, which ``src.backfill``
+	checks before adding columns to the table.
+	"""
 
-	cfg = config or PipelineConfig()
-	audio_paths = _collect_audio_files(input_file, input_dir)
 	output_path = Path(output_dir)
 	output_path.mkdir(parents=True, exist_ok=True)
 
-	all_records: list[dict[str, float | str]] = []
-	for audio_path in audio_paths:
-		records = _process_file(audio_path, output_path, cfg)
-		all_records.extend(records)
+	all_records: list[dict[str, float | str]] = list(
+		iter_features(
+			input_file=input_file,
+			input_dir=input_dir,
+			file_list=file_list,
+			output_dir=output_dir,
+			config=config,
+			sort_inputs=sort_inputs,
+			save_segments=True,
+			longest_first=longest_first,
+			duration_index_path=duration_index_path,
+			progress=progress,
+		)
+	)
 
+	cfg = _validate_config(config or PipelineConfig())
 	if not all_records:
-		columns = [
-			"segment_id",
-			"source_file",
-			"length",
-			"rms_energy",
-			"zcr",
-			"amplitude_mean",
-			"amplitude_contour",
-			"amplitude_contour_slope",
-			"amplitude_contour_curvature",
-			"sample_entropy_contour",
-			"kurtosis_contour",
-			"crest_factor",
-			"crest_factor_position",
-			"F0",
-			"HNR",
-			"Jitter",
-			"Shimmer",
-		]
-		df = pd.DataFrame(columns=columns)
+		df = pd.DataFrame(columns=_output_columns(cfg))
 	else:
 		df = pd.DataFrame(all_records)
 
 	output_csv = output_path / "features.csv"
 	df.to_csv(output_csv, index=False)
+	_write_run_config(output_path, cfg)
 	return df
 
 
@@ -211,6 +883,72 @@ def _build_parser() -> argparse.ArgumentParser:
 	group = parser.add_mutually_exclusive_group(required=True)
 	group.add_argument("--input-file", type=str, help="Path to a single WAV file to analyze.")
 	group.add_argument("--input-dir", type=str, help="Directory containing WAV files to analyze.")
+	group.add_argument(
+		"--file-list",
+		type=str,
+		help="Manifest with one WAV path per line, or a CSV with 'path' and optional 'duration' columns.",
+	)
+	parser.add_argument(
+		"--sort-inputs",
+		action="store_true",
+		help="Process inputs in sorted order instead of streaming them in discovery order.",
+	)
+	parser.add_argument(
+		"--vowel-backend",
+		choices=features.VOWEL_BACKENDS,
+		default="praat",
+		help="Vowel feature backend: Praat via Parselmouth, or the faster NumPy estimator.",
+	)
+	parser.add_argument(
+		"--segment-workers",
+		type=int,
+		default=1,
+		help="Number of workers analyzing the segments of each file in parallel.",
+	)
+	parser.add_argument(
+		"--segment-executor",
+		choices=SEGMENT_EXECUTORS,
+		default="thread",
+		help="Pool type used when --segment-workers is greater than 1.",
+	)
+	parser.add_argument(
+		"--segmentation",
+		choices=SEGMENTATION_MODES,
+		default="single",
+		help="Energy segmentation: frame the whole file, or refine only regions a coarse envelope pass flags.",
+	)
+	parser.add_argument(
+		"--file-workers",
+		type=int,
+		default=1,
+		help="Number of processes analyzing input files in parallel.",
+	)
+	parser.add_argument(
+		"--longest-first",
+		action="store_true",
+		help="With --file-workers > 1, schedule files longest-first using a header-only duration pre-pass.",
+	)
+	parser.add_argument(
+		"--duration-index",
+		type=str,
+		help="CSV cache for the header duration index, reused across runs and tools.",
+	)
+	parser.add_argument(
+		"--signal-cache",
+		type=str,
+		help="Directory caching decoded, resampled signals between runs.",
+	)
+	parser.add_argument(
+		"--signal-cache-max-mb",
+		type=int,
+		default=DEFAULT_MAX_BYTES // 1024**2,
+		help="Size limit of the signal cache in MB; least recently used entries are evicted.",
+	)
+	parser.add_argument(
+		"--progress",
+		action="store_true",
+		help="Report per-file progress and an ETA on stderr.",
+	)
 	parser.add_argument("--output-dir", type=str, default="results", help="Directory to store outputs.")
 	return parser
 
@@ -220,7 +958,25 @@ def main(argv: list[str] | None = None) -> int:
 	parser = _build_parser()
 	args = parser.parse_args(argv)
 
-	run_pipeline(input_file=args.input_file, input_dir=args.input_dir, output_dir=args.output_dir)
+	run_pipeline(
+		input_file=args.input_file,
+		input_dir=args.input_dir,
+		file_list=args.file_list,
+		output_dir=args.output_dir,
+		config=PipelineConfig(
+			vowel_backend=args.vowel_backend,
+			segment_workers=args.segment_workers,
+			segment_executor=args.segment_executor,
+			file_workers=args.file_workers,
+			segmentation=args.segmentation,
+			signal_cache_dir=args.signal_cache,
+			signal_cache_max_bytes=args.signal_cache_max_mb * 1024**2,
+		),
+		sort_inputs=args.sort_inputs,
+		longest_first=args.longest_first,
+		duration_index_path=args.duration_index,
+		progress=args.progress,
+	)
 	return 0
 
 
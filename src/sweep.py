@@ -0,0 +1,197 @@
+"""Parameter sweep over PipelineConfig variants that shares decoding and analysis work."""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+from dataclasses import asdict, fields, replace
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src import main as pipeline
+from src.analysis import preprocessing
+from src.analysis.signal_index import SignalIndex
+
+
+def expand_grid(
+	grid: Mapping[str, Sequence[Any]],
+	base: pipeline.PipelineConfig | None = None,
+) -> dict[str, pipeline.PipelineConfig]:
+	"""Expand a ``{field: [values, ...]}`` grid into configs keyed by config ID."""
+	base_config = base or pipeline.PipelineConfig()
+	known = {field.name for field in fields(pipeline.PipelineConfig)}
+	unknown = set(grid).difference(known)
+	if unknown:
+		raise ValueError(f"Unknown PipelineConfig fields in sweep grid: {', '.join(sorted(unknown))}")
+
+	names = list(grid)
+	combinations = itertools.product(*(grid[name] for name in names))
+	return {
+		f"cfg_{index:03d}": replace(base_config, **dict(zip(names, values)))
+		for index, values in enumerate(combinations, start=1)
+	}
+
+
+def _feature_key(config: pipeline.PipelineConfig) -> tuple:
+	"""Configs with equal keys give identical features for the same segment of the same signal."""
+	return tuple(getattr(config, name) for name in pipeline.FEATURE_FIELDS)
+
+
+def _signal_key(config: pipeline.PipelineConfig) -> tuple:
+	"""Configs with equal keys load an identical analysis-ready signal."""
+	return (config.target_sample_rate, config.signal_cache_dir)
+
+
+def _sweep_file(
+	audio_path: Path,
+	configs: Mapping[str, pipeline.PipelineConfig],
+) -> list[dict[str, float | str]]:
+	"""Run every config over one file, decoding once and analyzing each distinct segment once."""
+	signals: dict[tuple, np.ndarray] = {}
+	indexes: dict[tuple, SignalIndex] = {}
+	frame_energies: dict[tuple, np.ndarray] = {}
+	analyzed: dict[tuple, dict[str, float | str]] = {}
+	records: list[dict[str, float | str]] = []
+
+	for config_id, config in configs.items():
+		signal_key = _signal_key(config)
+		if signal_key not in signals:
+			signals[signal_key] = pipeline._load_signal(audio_path, config)
+		signal = signals[signal_key]
+
+		framing = (signal_key, config.frame_length, config.hop_length)
+		if framing not in frame_energies:
+			frame_energies[framing] = preprocessing.calculate_frame_energy(
+				signal, config.frame_length, config.hop_length
+			)
+		segments = pipeline._detect_segments(signal, config, frame_energies[framing])
+
+		feature_key = (signal_key, _feature_key(config))
+		pending = [segment for segment in segments if (feature_key, segment) not in analyzed]
+		if pending:
+			# Mirror the pipeline's choice of index versus direct statistics for this file.
+			signal_index = None
+			if pipeline._use_signal_index(len(signal), segments):
+				if signal_key not in indexes:
+					indexes[signal_key] = SignalIndex(signal)
+				signal_index = indexes[signal_key]
+			statistics = pipeline._batch_statistics(signal, pending, config, signal_index)
+			pending_records = pipeline._iter_segment_records(
+				signal, pending, [""] * len(pending), config, statistics=statistics
+			)
+			for segment, record in zip(pending, pending_records):
+				analyzed[(feature_key, segment)] = record
+
+		for index, segment in enumerate(segments, start=1):
+			record = dict(analyzed[(feature_key, segment)])
+			record["segment_id"] = f"{audio_path.stem}_{index:02d}"
+			record["source_file"] = audio_path.name
+			record["config_id"] = config_id
+			records.append(record)
+
+	return records
+
+
+def run_sweep(
+	configs: Mapping[str, pipeline.PipelineConfig] | Sequence[pipeline.PipelineConfig],
+	*,
+	input_file: str | None = None,
+	input_dir: str | None = None,
+	file_list: str | None = None,
+	output_dir: str | None = "results",
+	sort_inputs: bool = False,
+) -> pd.DataFrame:
+	"""Run several pipeline configs over the same inputs and return one tagged feature table.
+
+	Each file is decoded and resampled once per distinct target sample rate,
+	frame energies are shared between configs with the same framing, and a
+	segment found by several configs with the same feature settings is
+	analyzed once. Rows carry a ``config_id`` column; when ``output_dir`` is
+	set, ``sweep_features.csv`` and ``sweep_configs.csv`` (the parameters per
+	``config_id``) are written there. Segment WAVs are not written.
+	"""
+
+	if not isinstance(configs, Mapping):
+		configs = {f"cfg_{index:03d}": config for index, config in enumerate(configs, start=1)}
+	if not configs:
+		raise ValueError("A sweep needs at least one PipelineConfig.")
+	for config in configs.values():
+		pipeline._validate_config(config)
+
+	audio_paths = pipeline._collect_audio_files(input_file, input_dir, file_list, sort_inputs=sort_inputs)
+
+	all_records: list[dict[str, float | str]] = []
+	for audio_path in audio_paths:
+		all_records.extend(_sweep_file(audio_path, configs))
+
+	leading = ["config_id", "segment_id", "source_file"]
+	if all_records:
+		df = pd.DataFrame(all_records)
+	else:
+		# Configs may differ in n_mfcc, so take the union of their columns.
+		columns = dict.fromkeys(
+			["config_id", *(column for config in configs.values() for column in pipeline._output_columns(config))]
+		)
+		df = pd.DataFrame(columns=list(columns))
+	df = df[leading + [column for column in df.columns if column not in leading]]
+
+	if output_dir is not None:
+		output_path = Path(output_dir)
+		output_path.mkdir(parents=True, exist_ok=True)
+		df.to_csv(output_path / "sweep_features.csv", index=False)
+		config_table = pd.DataFrame(
+			[{"config_id": config_id, **asdict(config)} for config_id, config in configs.items()]
+		)
+		config_table.to_csv(output_path / "sweep_configs.csv", index=False)
+
+	return df
+
+
+def _build_parser() -> argparse.ArgumentParser:
+	"""Create the CLI argument parser for sweep runs."""
+	parser = argparse.ArgumentParser(description="Run the cough analysis pipeline over a grid of configs.")
+	group = parser.add_mutually_exclusive_group(required=True)
+	group.add_argument("--input-file", type=str, help="Path to a single WAV file to analyze.")
+	group.add_argument("--input-dir", type=str, help="Directory containing WAV files to analyze.")
+	group.add_argument("--file-list", type=str, help="Manifest of WAV paths to analyze.")
+	parser.add_argument(
+		"--grid",
+		type=str,
+		required=True,
+		help='JSON file mapping PipelineConfig fields to value lists, e.g. {"energy_threshold_ratio": [0.05, 0.1]}.',
+	)
+	parser.add_argument("--output-dir", type=str, default="results", help="Directory to store outputs.")
+	parser.add_argument(
+		"--sort-inputs",
+		action="store_true",
+		help="Process inputs in sorted order instead of streaming them in discovery order.",
+	)
+	return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+	"""Parse CLI arguments, run the sweep, and return an exit code."""
+	parser = _build_parser()
+	args = parser.parse_args(argv)
+
+	with open(args.grid, encoding="utf-8") as handle:
+		grid = json.load(handle)
+
+	run_sweep(
+		expand_grid(grid),
+		input_file=args.input_file,
+		input_dir=args.input_dir,
+		file_list=args.file_list,
+		output_dir=args.output_dir,
+		sort_inputs=args.sort_inputs,
+	)
+	return 0
+
+
+if __name__ == "__main__":
+	raise SystemExit(main(sys.argv[1:]))
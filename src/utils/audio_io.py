@@ -56,6 +56,21 @@ def load_wav(file_path: str) -> tuple[np.ndarray, int]:
 
     return signal, sample_rate
 
+def read_wav_info(file_path: str) -> tuple[int, int]:
+    """
+    Reads only the header of a WAV file.
+
+    Args:
+        file_path: The path to the WAV file.
+
+    Returns:
+        A tuple containing:
+            - The number of frames in the file.
+            - The sample rate of the audio file.
+    """
+    with wave.open(file_path, 'rb') as wf:
+        return wf.getnframes(), wf.getframerate()
+
 def save_wav(file_path: str, signal: np.ndarray, sample_rate: int):
     """
     Saves a NumPy array as a WAV file.
@@ -0,0 +1,106 @@
+"""Helpers for discovering input audio files without up-front metadata scans."""
+
+from __future__ import annotations
+
+import csv
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """A single input listed in a file-list manifest."""
+
+    path: Path
+    duration: float | None = None
+
+
+def iter_wav_files(directory: str | os.PathLike[str]) -> Iterator[Path]:
+    """
+    Recursively yields WAV files below a directory as they are discovered.
+
+    Uses ``os.scandir`` so file-type checks come from the directory listing
+    itself instead of a separate ``stat`` call per path, and yields each
+    match immediately so processing can start while the scan continues.
+    Files are yielded in filesystem order; symlinked directories are not
+    followed.
+
+    Args:
+        directory: The root directory to scan.
+
+    Yields:
+        Paths of files ending in ``.wav``.
+    """
+    pending = [os.fspath(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".wav") and entry.is_file():
+                        yield Path(entry.path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
+
+def read_file_list(manifest_path: str | os.PathLike[str]) -> Iterator[ManifestEntry]:
+    """
+    Lazily reads input paths from a manifest file.
+
+    The manifest is either plain text with one path per line (blank lines and
+    lines starting with ``#`` are ignored), or a CSV whose header contains a
+    ``path`` column and an optional ``duration`` column in seconds. Relative
+    paths are resolved against the manifest's directory. Paths are not
+    checked for existence here to avoid per-file metadata I/O.
+
+    Args:
+        manifest_path: The path to the manifest file.
+
+    Yields:
+        One ``ManifestEntry`` per listed input, in manifest order.
+    """
+    manifest = Path(manifest_path)
+    base_dir = manifest.parent
+
+    with open(manifest, newline="", encoding="utf-8") as handle:
+        first_line = handle.readline()
+        header = [column.strip().lower() for column in next(csv.reader([first_line]), [])]
+
+        if "path" in header:
+            path_index = header.index("path")
+            duration_index = header.index("duration") if "duration" in header else None
+            for row_number, row in enumerate(csv.reader(handle), start=2):
+                if not row or not row[path_index].strip():
+                    continue
+                duration = None
+                if duration_index is not None and duration_index < len(row) and row[duration_index].strip():
+                    try:
+                        duration = float(row[duration_index])
+                    except ValueError as exc:
+                        raise ValueError(
+                            f"Invalid duration on line {row_number} of {manifest}: {row[duration_index]!r}"
+                        ) from exc
+                yield ManifestEntry(_resolve(base_dir, row[path_index].strip()), duration)
+            return
+
+        for line in _chain_first(first_line, handle):
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            yield ManifestEntry(_resolve(base_dir, stripped))
+
+
+def _chain_first(first_line: str, handle) -> Iterator[str]:
+    """Yield an already-consumed first line followed by the rest of the file."""
+    yield first_line
+    yield from handle
+
+
+def _resolve(base_dir: Path, raw_path: str) -> Path:
+    """Resolve a manifest path relative to the manifest's directory."""
+    path = Path(raw_path).expanduser()
+    return path if path.is_absolute() else base_dir / path
@@ -0,0 +1,146 @@
+"""Header-only duration index of WAV inputs, cached on disk for reuse."""
+
+from __future__ import annotations
+
+import csv
+import os
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Hashable, Iterable, Mapping, TypeVar
+
+from src.utils import audio_io
+
+T = TypeVar("T", bound=Hashable)
+
+INDEX_COLUMNS = ("path", "size", "mtime_ns", "sample_rate", "n_frames", "duration")
+
+
+@dataclass(frozen=True)
+class DurationEntry:
+    """Header facts for one WAV file plus the stat fields used to validate the cache."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    sample_rate: int
+    n_frames: int
+
+    @property
+    def duration(self) -> float:
+        return self.n_frames / self.sample_rate if self.sample_rate else 0.0
+
+
+def load_duration_index(cache_path: str | os.PathLike[str]) -> dict[str, DurationEntry]:
+    """
+    Loads a cached duration index.
+
+    The cache is a plain CSV with the columns in ``INDEX_COLUMNS`` so other
+    tools can read it directly.
+
+    Args:
+        cache_path: The path to the cache file.
+
+    Returns:
+        Entries keyed by absolute path; empty when the cache does not exist.
+    """
+    path = Path(cache_path)
+    if not path.exists():
+        return {}
+
+    entries = {}
+    with open(path, newline="", encoding="utf-8") as handle:
+        for row in csv.DictReader(handle):
+            entry = DurationEntry(
+                path=row["path"],
+                size=int(row["size"]),
+                mtime_ns=int(row["mtime_ns"]),
+                sample_rate=int(row["sample_rate"]),
+                n_frames=int(row["n_frames"]),
+            )
+            entries[entry.path] = entry
+    return entries
+
+
+def save_duration_index(
+    cache_path: str | os.PathLike[str], entries: Mapping[str, DurationEntry]
+) -> None:
+    """Writes the duration index atomically so concurrent readers never see a partial file."""
+    path = Path(cache_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(INDEX_COLUMNS)
+        for entry in entries.values():
+            writer.writerow(
+                [entry.path, entry.size, entry.mtime_ns, entry.sample_rate, entry.n_frames, f"{entry.duration:.6f}"]
+            )
+    os.replace(temporary, path)
+
+
+def build_duration_index(
+    paths: Iterable[Path],
+    cache_path: str | os.PathLike[str] | None = None,
+    known_durations: Mapping[Path, float] | None = None,
+) -> dict[Path, float]:
+    """
+    Returns the duration in seconds of every input, reading only WAV headers.
+
+    Durations in ``known_durations`` (e.g. from a manifest) are trusted as-is.
+    Otherwise a cached entry is reused when the file's size and modification
+    time are unchanged, and the header is read for everything else. Files
+    whose header cannot be read are omitted. The cache is rewritten when new
+    entries were read.
+
+    Args:
+        paths: The input files.
+        cache_path: Optional CSV cache shared across runs and tools.
+        known_durations: Precomputed durations that skip header reads.
+
+    Returns:
+        A mapping from each input path to its duration in seconds.
+    """
+    cache = load_duration_index(cache_path) if cache_path is not None else {}
+    known = known_durations or {}
+    durations: dict[Path, float] = {}
+    updated = False
+
+    for path in paths:
+        if path in known:
+            durations[path] = float(known[path])
+            continue
+
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+
+        entry = cache.get(key)
+        if entry is None or entry.size != stat.st_size or entry.mtime_ns != stat.st_mtime_ns:
+            try:
+                n_frames, sample_rate = audio_io.read_wav_info(str(path))
+            except (OSError, EOFError, wave.Error):
+                continue
+            entry = DurationEntry(key, stat.st_size, stat.st_mtime_ns, sample_rate, n_frames)
+            cache[key] = entry
+            updated = True
+
+        durations[path] = entry.duration
+
+    if cache_path is not None and updated:
+        save_duration_index(cache_path, cache)
+
+    return durations
+
+
+def schedule_longest_first(items: Iterable[T], durations: Mapping[T, float]) -> list[T]:
+    """
+    Orders inputs longest-processing-time first.
+
+    Dispatching the longest files first keeps a huge file from starting last
+    and becoming the straggler of a parallel batch. Files without a known
+    duration are scheduled first, since they may be arbitrarily long.
+    """
+    return sorted(items, key=lambda item: -durations.get(item, float("inf")))
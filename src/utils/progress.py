@@ -0,0 +1,59 @@
+"""Progress and ETA reporting for batch runs."""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Callable, TextIO
+
+
+class ProgressReporter:
+    """
+    Reports files processed and an ETA based on audio seconds processed so far.
+
+    The ETA assumes processing time is proportional to audio duration, which
+    is what the header duration index provides up front.
+    """
+
+    def __init__(
+        self,
+        total_files: int,
+        total_seconds: float,
+        stream: TextIO | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.total_files = total_files
+        self.total_seconds = total_seconds
+        self.stream = stream if stream is not None else sys.stderr
+        self.clock = clock
+        self.files_done = 0
+        self.seconds_done = 0.0
+        self._started = clock()
+
+    def eta(self) -> float | None:
+        """Estimated seconds remaining, or None before any audio has been processed."""
+        if self.seconds_done <= 0:
+            return None
+        elapsed = self.clock() - self._started
+        remaining = max(self.total_seconds - self.seconds_done, 0.0)
+        return elapsed * remaining / self.seconds_done
+
+    def update(self, audio_seconds: float, label: str = "") -> str:
+        """Record one finished file and write a progress line."""
+        self.files_done += 1
+        self.seconds_done += audio_seconds
+        eta = self.eta()
+        eta_text = "--" if eta is None else _format_seconds(eta)
+        percent = 100.0 * self.seconds_done / self.total_seconds if self.total_seconds else 100.0
+        line = (
+            f"[{self.files_done}/{self.total_files}] {percent:5.1f}% of audio, ETA {eta_text}"
+            + (f" - {label}" if label else "")
+        )
+        print(line, file=self.stream, flush=True)
+        return line
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{secs:02d}"
@@ -0,0 +1,210 @@
+"""On-disk cache of decoded, resampled signals stored as memory-mapped ``.npy`` files."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from src.utils import audio_io
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+_HASH_CHUNK = 1024 * 1024
+
+
+class SignalCache:
+    """
+    Persistent cache of ready-to-analyze float32 signals.
+
+    Entries are keyed by the source file's content hash, its original sample
+    rate and the target sample rate, so renamed or copied files still hit and
+    edited files miss. Each entry is a ``.npy`` file opened with
+    ``mmap_mode="r"`` (zero-copy) plus a JSON sidecar holding its length and
+    CRC32 for the integrity check. Entries are evicted least-recently-used
+    first once the cache, including the small per-file hash memos, exceeds
+    ``max_bytes``; hits refresh an entry's modification time, which serves
+    as the LRU clock across processes.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        verify: bool = True,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.verify = verify
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / "hashes").mkdir(exist_ok=True)
+
+    def file_hash(self, audio_path: str | os.PathLike[str]) -> str:
+        """
+        Returns the BLAKE2b content hash of a source file.
+
+        The hash is memoized on disk per (absolute path, size, mtime) so
+        unchanged files are not re-read on later runs.
+        """
+        stat = os.stat(audio_path)
+        identity = f"{os.path.abspath(audio_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        memo = self.directory / "hashes" / hashlib.sha1(identity.encode("utf-8")).hexdigest()
+        try:
+            return memo.read_text(encoding="utf-8").strip()
+        except OSError:
+            pass
+
+        digest = hashlib.blake2b(digest_size=20)
+        with open(audio_path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK), b""):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+        _atomic_write_text(memo, content_hash)
+        return content_hash
+
+    def key(self, audio_path: str | os.PathLike[str], target_rate: int) -> str:
+        """Cache key for a source file resampled to ``target_rate``."""
+        _, original_rate = audio_io.read_wav_info(str(audio_path))
+        return f"{self.file_hash(audio_path)}_{original_rate}_{target_rate}"
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}.npy", self.directory / f"{key}.json"
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Memory-map a cached signal, or return None when missing or corrupt."""
+        data_path, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            signal = np.load(data_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        valid = signal.dtype == np.float32 and signal.ndim == 1 and signal.size == meta.get("n_samples")
+        if valid and self.verify:
+            valid = zlib.crc32(memoryview(signal)) == meta.get("crc32")
+        if not valid:
+            del signal
+            self.remove(key)
+            return None
+
+        try:
+            os.utime(data_path)
+        except OSError:
+            pass
+        return signal
+
+    def put(self, key: str, signal: np.ndarray) -> np.ndarray:
+        """Store a signal as float32, evict old entries, and return the memory-mapped copy."""
+        data_path, meta_path = self._paths(key)
+        data = np.ascontiguousarray(signal, dtype=np.float32)
+
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".npy.tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                np.save(handle, data)
+            _atomic_write_text(
+                meta_path, json.dumps({"n_samples": int(data.size), "crc32": zlib.crc32(memoryview(data))})
+            )
+            os.replace(temporary, data_path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+        self.evict(keep=key)
+        cached = self.get(key)
+        return cached if cached is not None else data
+
+    def load_signal(
+        self,
+        audio_path: str | os.PathLike[str],
+        target_rate: int,
+        compute: Callable[[Path, int], np.ndarray],
+    ) -> np.ndarray:
+        """Return the cached signal for a file, computing and storing it on a miss."""
+        key = self.key(audio_path, target_rate)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        return self.put(key, compute(Path(audio_path), target_rate))
+
+    def remove(self, key: str) -> None:
+        """Delete an entry; entries still mapped elsewhere are left for a later eviction."""
+        for path in self._paths(key):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                return
+
+    def size(self) -> int:
+        """Total bytes of cached signal data and hash memos."""
+        return sum(_file_size(path) for path in self.directory.glob("*.npy")) + self._memo_bytes()
+
+    def _memo_bytes(self) -> int:
+        return sum(_file_size(path) for path in (self.directory / "hashes").iterdir())
+
+    def evict(self, keep: str | None = None) -> None:
+        """
+        Remove least-recently-used entries until the cache fits in ``max_bytes``.
+
+        Hash memos count toward the limit, and memos whose content hash no
+        longer has any cached entry are deleted after an eviction.
+        """
+        entries = []
+        for path in self.directory.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path.stem))
+
+        total = sum(size for _, size, _ in entries) + self._memo_bytes()
+        evicted = False
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self.remove(key)
+            total -= size
+            evicted = True
+
+        if evicted:
+            self.prune_hashes()
+
+    def prune_hashes(self) -> None:
+        """Delete hash memos that no cached entry refers to any more."""
+        live = {path.stem.split("_", 1)[0] for path in self.directory.glob("*.npy")}
+        for memo in (self.directory / "hashes").iterdir():
+            try:
+                content_hash = memo.read_text(encoding="utf-8").strip()
+            except OSError:
+                continue
+            if content_hash not in live:
+                try:
+                    memo.unlink()
+                except OSError:
+                    pass
+
+
+def _file_size(path: Path) -> int:
+    """Size of a file, or 0 when it disappeared concurrently."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write a small text file via rename so readers never see partial content."""
+    fd, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    os.replace(temporary, path)
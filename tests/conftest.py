@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.utils import audio_io
+
+# (start sample, length in samples, peak amplitude, frequency in Hz) per tone burst.
+TWO_BURSTS = ((2_000, 4_000, 0.9, 180), (14_000, 4_000, 0.4, 220))
+
+
+@pytest.fixture
+def synthesize_bursts():
+	"""Build a noise floor with sine bursts laid out as ``(start, length, amplitude, frequency)``."""
+
+	def _synthesize(
+		bursts=TWO_BURSTS,
+		*,
+		seconds: float = 2.0,
+		sample_rate: int = 16_000,
+		noise: float = 0.01,
+		seed: int = 0,
+		decay: float = 0.0,
+	) -> np.ndarray:
+		size = int(seconds * sample_rate)
+		signal = np.random.default_rng(seed).normal(scale=noise, size=size) if noise else np.zeros(size)
+		for start, length, amplitude, frequency in bursts:
+			envelope = np.exp(-np.linspace(0.0, decay, length))
+			tone = np.sin(2 * np.pi * frequency * np.arange(length) / sample_rate)
+			signal[start : start + length] += amplitude * envelope * tone
+		return signal
+
+	return _synthesize
+
+
+@pytest.fixture
+def write_bursts(tmp_path, synthesize_bursts):
+	"""Write ``synthesize_bursts(...)`` to ``tmp_path / name`` and return the WAV path."""
+
+	def _write(name: str = "bursts.wav", bursts=TWO_BURSTS, *, sample_rate: int = 16_000, **options) -> Path:
+		path = tmp_path / name
+		path.parent.mkdir(parents=True, exist_ok=True)
+		audio_io.save_wav(str(path), synthesize_bursts(bursts, sample_rate=sample_rate, **options), sample_rate)
+		return path
+
+	return _write
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import backfill, main
+
+
+@pytest.fixture
+def previous_run(tmp_path, write_bursts):
+	audio_path = write_bursts(seed=5)
+	output_dir = tmp_path / "results"
+	main.run_pipeline(
+		input_file=str(audio_path),
+		output_dir=str(output_dir),
+		config=main.PipelineConfig(vowel_backend="fast"),
+	)
+	return output_dir / "features.csv"
+
+
+@pytest.mark.integration
+def test_backfill_restores_dropped_columns(previous_run):
+	full = pd.read_csv(previous_run)
+	dropped = ["spectral_centroid", "mfcc_2", "F0"]
+	full.drop(columns=dropped).to_csv(previous_run, index=False)
+
+	config = main.PipelineConfig(vowel_backend="fast")
+	backfill.run_backfill(["spectral_centroid", "mfcc_2", "vowel"], table_path=str(previous_run), config=config)
+
+	restored = pd.read_csv(previous_run)
+	assert list(restored.columns) == [c for c in full.columns if c not in dropped] + dropped
+	# Recomputed from 16-bit segment WAVs, so allow quantization error.
+	np.testing.assert_allclose(restored["spectral_centroid"], full["spectral_centroid"], rtol=1e-2)
+	np.testing.assert_allclose(restored["F0"], full["F0"], rtol=1e-2)
+	assert not previous_run.with_name("features.csv.backfill.csv").exists()
+
+
+@pytest.mark.integration
+def test_backfill_fills_only_missing_rows_and_resumes(previous_run):
+	df = pd.read_csv(previous_run)
+	sentinel = df.loc[0, "rms_energy"]
+	df.loc[1:, "rms_energy"] = np.nan
+	df.to_csv(previous_run, index=False)
+
+	# A journal left by an interrupted run is reused instead of recomputed.
+	journal = previous_run.with_name("features.csv.backfill.csv")
+	pd.DataFrame({"segment_id": [df.loc[1, "segment_id"]], "rms_energy": [123.0]}).to_csv(journal, index=False)
+
+	backfill.main(["--backfill", "rms_energy", "--output-dir", str(previous_run.parent)])
+
+	filled = pd.read_csv(previous_run)
+	assert filled.loc[0, "rms_energy"] == sentinel
+	assert filled.loc[1, "rms_energy"] == 123.0
+	assert filled["rms_energy"].notna().all()
+	assert not journal.exists()
+
+
+def test_resolve_columns_maps_groups_and_rejects_unknown_names():
+	config = main.PipelineConfig(n_mfcc=2)
+	selected = backfill.resolve_columns(["mfcc_1", "vowel", "zcr"], config)
+	assert selected == {"spectral": ["mfcc_1"], "vowel": ["F0", "HNR", "Jitter", "Shimmer"], "time": ["zcr"]}
+
+	missing = backfill.resolve_columns(["missing"], config, existing_columns=["segment_id", "F0", "HNR"])
+	assert missing["vowel"] == ["Jitter", "Shimmer"]
+
+	with pytest.raises(ValueError):
+		backfill.resolve_columns(["not_a_feature"], config)
+
+
+@pytest.mark.integration
+def test_backfill_rejects_invalid_config(previous_run):
+	with pytest.raises(ValueError, match="segment executor"):
+		backfill.run_backfill(
+			["zcr"], table_path=str(previous_run), config=main.PipelineConfig(segment_executor="bogus")
+		)
+
+
+@pytest.mark.integration
+def test_backfill_uses_and_enforces_the_run_config(tmp_path, write_bursts):
+	audio_path = write_bursts("burst.wav", [(2_000, 4_000, 0.9, 180)], seed=6)
+	output_dir = tmp_path / "results"
+	config = main.PipelineConfig(vowel_backend="fast", frame_length=480, hop_length=240, n_mfcc=5)
+	main.run_pipeline(input_file=str(audio_path), output_dir=str(output_dir), config=config)
+	table = output_dir / "features.csv"
+	full = pd.read_csv(table)
+	dropped = ["amplitude_contour", "amplitude_contour_slope", "mfcc_5"]
+	full.drop(columns=dropped).to_csv(table, index=False)
+
+	with pytest.raises(ValueError, match="hop_length"):
+		backfill.main(["--backfill", "missing", "--output-dir", str(output_dir), "--hop-length", "160"])
+
+	backfill.main(["--backfill", "missing", "--output-dir", str(output_dir)])
+	restored = pd.read_csv(table)
+	assert "mfcc_6" not in restored.columns
+	assert restored["amplitude_contour"].str.split().str.len().equals(full["amplitude_contour"].str.split().str.len())
+	np.testing.assert_allclose(restored["amplitude_contour_slope"], full["amplitude_contour_slope"], rtol=1e-2, atol=1e-3)
+	np.testing.assert_allclose(restored["mfcc_5"], full["mfcc_5"], rtol=1e-2, atol=1e-2)
@@ -40,6 +40,9 @@ def test_pipeline_generates_feature_csv(tmp_path):
 		"crest_factor_position",
 		"F0",
 		"HNR",
+		"spectral_centroid",
+		"spectral_flux",
+		"mfcc_1",
 	}
 
 	missing = expected_columns.difference(df.columns)
@@ -77,3 +80,271 @@ def test_pipeline_keeps_low_snr_segments(tmp_path):
 
 	assert not df.empty, "Low-SNR segment should persist through the pipeline."
 	assert any(df["segment_id"].str.contains("low_snr")), "Segment IDs should include low_snr recording."
+
+
+@pytest.mark.integration
+def test_iter_features_streams_records_without_side_effects(tmp_path, monkeypatch):
+	input_file = Path("tests/test_data/sample.wav").resolve()
+	# Anything written relative to the working directory (e.g. a default results/) lands in tmp_path.
+	monkeypatch.chdir(tmp_path)
+
+	records = main.iter_features(input_file=str(input_file), output_dir=str(tmp_path / "out"))
+	first = next(records)
+	list(records)
+
+	assert first["source_file"] == input_file.name
+	assert first["segment_id"].startswith(input_file.stem)
+	assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.integration
+def test_iter_features_batches_and_writes_csv(tmp_path):
+	input_file = Path("tests/test_data/sample.wav").resolve()
+	output_dir = tmp_path / "results"
+
+	batches = list(
+		main.iter_features(
+			input_file=str(input_file),
+			output_dir=str(output_dir),
+			write_csv=True,
+			batch_by_file=True,
+		)
+	)
+
+	assert len(batches) == 1
+	df = pd.read_csv(output_dir / "features.csv")
+	assert list(df["segment_id"]) == [record["segment_id"] for record in batches[0]]
+	assert not (output_dir / "segments").exists()
+
+
+@pytest.mark.integration
+def test_pipeline_accepts_file_list(tmp_path):
+	input_file = Path("tests/test_data/sample.wav").resolve()
+	manifest = tmp_path / "inputs.csv"
+	manifest.write_text(f"path,duration\n{input_file},\n")
+
+	df = main.run_pipeline(file_list=str(manifest), output_dir=str(tmp_path / "results"))
+
+	assert not df.empty
+	assert set(df["source_file"]) == {input_file.name}
+
+
+@pytest.mark.integration
+def test_pipeline_fast_vowel_backend(tmp_path):
+	input_file = Path("tests/test_data/sample.wav").resolve()
+	config = main.PipelineConfig(vowel_backend="fast")
+
+	df = main.run_pipeline(input_file=str(input_file), output_dir=str(tmp_path), config=config)
+
+	assert df["F0"].iloc[0] == pytest.approx(440.0, rel=1e-2)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("executor", ["thread", "process"])
+@pytest.mark.parametrize("cached", [False, True])
+def test_segment_parallelism_preserves_order_and_values(tmp_path, write_bursts, executor, cached):
+	input_file = write_bursts(
+		bursts=[(start, 3_000, 0.8, 200) for start in (2_000, 14_000, 26_000, 38_000)], seconds=3
+	)
+
+	# A cached signal is a float32 memmap, which process workers must share in its own dtype.
+	cache_dir = str(tmp_path / "cache") if cached else None
+	sequential_config = main.PipelineConfig(signal_cache_dir=cache_dir)
+	sequential = pd.DataFrame(list(main.iter_features(input_file=str(input_file), config=sequential_config)))
+	parallel_config = main.PipelineConfig(
+		segment_workers=2, segment_executor=executor, signal_cache_dir=cache_dir
+	)
+	parallel = pd.DataFrame(list(main.iter_features(input_file=str(input_file), config=parallel_config)))
+
+	assert len(sequential) == 4
+	pd.testing.assert_frame_equal(sequential, parallel)
+
+
+@pytest.mark.integration
+def test_file_workers_longest_first_keeps_input_order(tmp_path, write_bursts):
+	input_dir = tmp_path / "inputs"
+	for name, seconds in (("a", 1), ("b", 3), ("c", 2)):
+		write_bursts(f"inputs/{name}.wav", [(1_000, 3_000, 0.8, 200)], seconds=seconds, noise=0.0)
+
+	index_path = tmp_path / "durations.csv"
+	batches = list(
+		main.iter_features(
+			input_dir=str(input_dir),
+			config=main.PipelineConfig(file_workers=2),
+			sort_inputs=True,
+			batch_by_file=True,
+			longest_first=True,
+			duration_index_path=str(index_path),
+		)
+	)
+
+	assert [batch[0]["source_file"] for batch in batches] == ["a.wav", "b.wav", "c.wav"]
+	assert index_path.exists()
+
+
+@pytest.mark.integration
+def test_longest_first_without_file_workers_skips_duration_prepass(monkeypatch):
+	input_file = Path("tests/test_data/sample.wav").resolve()
+
+	def _no_prepass(*args, **kwargs):
+		raise AssertionError("duration pre-pass should not run")
+
+	monkeypatch.setattr(main.duration_index, "build_duration_index", _no_prepass)
+
+	with pytest.warns(UserWarning, match="longest_first"):
+		records = list(main.iter_features(input_file=str(input_file), longest_first=True))
+
+	assert records
+
+
+@pytest.mark.integration
+def test_file_workers_submit_through_bounded_window(write_bursts):
+	paths = [
+		write_bursts(f"file_{index}.wav", [(1_000, 3_000, 0.8, 200)], seconds=0.5, noise=0.0) for index in range(8)
+	]
+
+	pulled = []
+
+	def _discover():
+		for path in paths:
+			pulled.append(path)
+			yield path
+
+	config = main.PipelineConfig(file_workers=2)
+	results = main._iter_parallel_file_records(_discover(), config, None, None, ordered=False)
+	first_path, _ = next(results)
+
+	assert len(pulled) == 2 * config.file_workers
+	assert sorted([first_path, *(path for path, _ in results)]) == paths
+
+
+@pytest.mark.integration
+def test_pipeline_signal_cache_reuses_resampled_signal(tmp_path, write_bursts):
+	sample_rate = 44_100
+	input_file = write_bursts("hi_rate.wav", [(4_000, 12_000, 0.8, 200)], sample_rate=sample_rate, seconds=1, seed=6)
+	config = main.PipelineConfig(signal_cache_dir=str(tmp_path / "cache"))
+
+	first = main.run_pipeline(input_file=str(input_file), output_dir=str(tmp_path / "first"), config=config)
+	second = main.run_pipeline(input_file=str(input_file), output_dir=str(tmp_path / "second"), config=config)
+
+	assert len(list((tmp_path / "cache").glob(f"*_{sample_rate}_16000.npy"))) == 1
+	pd.testing.assert_frame_equal(first, second)
+
+	# Cached signals are stored as float32, so features differ slightly from an uncached run.
+	uncached = main.run_pipeline(input_file=str(input_file), output_dir=str(tmp_path / "uncached"))
+	numeric = uncached.select_dtypes("number").columns
+	pd.testing.assert_frame_equal(second[numeric], uncached[numeric], check_exact=False, rtol=1e-5, atol=1e-8)
+	for cached_contour, uncached_contour in zip(second["amplitude_contour"], uncached["amplitude_contour"]):
+		np.testing.assert_allclose(
+			np.array(cached_contour.split(), dtype=float), np.array(uncached_contour.split(), dtype=float), atol=1e-5
+		)
+
+
+@pytest.mark.integration
+def test_coarse_segmentation_matches_single_stage(write_bursts):
+	input_file = write_bursts(
+		"sparse.wav", [(8_000, 5_000, 0.8, 190), (60_000, 5_000, 0.3, 250)], seconds=6, noise=0.005, seed=2
+	)
+
+	single = pd.DataFrame(list(main.iter_features(input_file=str(input_file))))
+	coarse = pd.DataFrame(
+		list(main.iter_features(input_file=str(input_file), config=main.PipelineConfig(segmentation="coarse")))
+	)
+
+	assert len(single) == 2
+	pd.testing.assert_frame_equal(coarse, single)
+
+
+@pytest.mark.integration
+def test_analyze_signal_matches_file_pipeline_without_disk_io(tmp_path, monkeypatch):
+	input_file = Path("tests/test_data/sample.wav").resolve()
+	signal, sample_rate = audio_io.load_wav(str(input_file))
+	config = main.PipelineConfig(vowel_backend="fast")
+	expected = pd.DataFrame(list(main.iter_features(input_file=str(input_file), config=config)))
+
+	def _no_disk(*args, **kwargs):
+		raise AssertionError("in-memory analysis must not read or write WAV files")
+
+	monkeypatch.setattr(audio_io, "load_wav", _no_disk)
+	monkeypatch.setattr(audio_io, "save_wav", _no_disk)
+	monkeypatch.chdir(tmp_path)
+
+	records, segments = main.analyze_signal(
+		signal, sample_rate, config, name=input_file.name, return_segments=True
+	)
+
+	pd.testing.assert_frame_equal(pd.DataFrame(records), expected)
+	assert len(segments) == len(records)
+	assert all(np.max(np.abs(segment)) == pytest.approx(1.0) for segment in segments)
+	assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.integration
+def test_analyze_signals_batches_mixed_sample_rates(synthesize_bursts):
+	loud = synthesize_bursts([(4_000, 12_000, 0.8, 200)], seconds=1, sample_rate=44_100, noise=0.0)
+	quiet = loud[::2] * 0.1
+
+	results = main.analyze_signals(
+		[loud, quiet], np.array([44_100, 22_050]), main.PipelineConfig(vowel_backend="fast")
+	)
+
+	assert [[record["source_file"] for record in records] for records in results] == [
+		["signal_001"],
+		["signal_002"],
+	]
+	assert results[0][0]["segment_id"] == "signal_001_01"
+	assert results[0][0]["length"] == pytest.approx(results[1][0]["length"], rel=1e-2)
+	with pytest.raises(ValueError):
+		main.analyze_signals([loud], [44_100, 22_050])
+
+	from_generator = main.analyze_signals(
+		[loud, quiet], (rate for rate in (44_100, 22_050)), main.PipelineConfig(vowel_backend="fast")
+	)
+	assert from_generator == results
+
+	single = main.analyze_signal(loud, np.int64(44_100), main.PipelineConfig(vowel_backend="fast"))
+	assert single[0]["length"] == pytest.approx(results[0][0]["length"])
+
+
+@pytest.mark.integration
+def test_signal_index_statistics_match_direct_statistics(write_bursts, monkeypatch):
+	input_file = write_bursts(
+		"decaying.wav", [(2_000, 5_000, 0.8, 210), (14_000, 5_000, 0.8, 210)], noise=0.005, seed=4, decay=4.0
+	)
+	config = main.PipelineConfig(vowel_backend="fast")
+
+	monkeypatch.setattr(main, "_use_signal_index", lambda signal_length, segments: False)
+	direct = pd.DataFrame(list(main.iter_features(input_file=str(input_file), config=config)))
+	monkeypatch.setattr(main, "_use_signal_index", lambda signal_length, segments: True)
+	indexed = pd.DataFrame(list(main.iter_features(input_file=str(input_file), config=config)))
+
+	numeric = direct.select_dtypes("number").columns
+	pd.testing.assert_frame_equal(indexed[numeric], direct[numeric], check_exact=False, rtol=1e-7)
+
+
+def test_signal_index_needs_many_segments_covering_the_signal():
+	dense = [(index * 1_000, index * 1_000 + 600) for index in range(10)]
+	sparse = [(index * 100_000, index * 100_000 + 600) for index in range(10)]
+	assert main._use_signal_index(10_000, dense)
+	assert not main._use_signal_index(1_000_000, sparse)
+	assert not main._use_signal_index(10_000, dense[: main.SIGNAL_INDEX_MIN_SEGMENTS - 1])
+
+
+@pytest.mark.integration
+def test_empty_run_writes_the_same_columns_as_a_full_run(tmp_path):
+	config = main.PipelineConfig(vowel_backend="fast", n_mfcc=3)
+	full = main.run_pipeline(
+		input_file=str(Path("tests/test_data/sample.wav").resolve()), output_dir=str(tmp_path / "full"), config=config
+	)
+	(tmp_path / "no_inputs").mkdir()
+	main.run_pipeline(input_dir=str(tmp_path / "no_inputs"), output_dir=str(tmp_path / "empty"), config=config)
+
+	empty = pd.read_csv(tmp_path / "empty" / "features.csv")
+	assert empty.empty
+	assert list(empty.columns) == list(full.columns) == main._output_columns(config)
+
+
+def test_validate_config_rejects_more_mfccs_than_mel_bands():
+	main._validate_config(main.PipelineConfig(n_mfcc=40))
+	with pytest.raises(ValueError, match="n_mfcc"):
+		main._validate_config(main.PipelineConfig(n_mfcc=41))
@@ -0,0 +1,83 @@
+import json
+
+import pandas as pd
+import pytest
+
+from src import main, sweep
+
+
+@pytest.fixture
+def burst_file(write_bursts):
+	return write_bursts(seed=3)
+
+
+@pytest.mark.integration
+def test_sweep_matches_individual_runs(burst_file, tmp_path):
+	configs = sweep.expand_grid(
+		{"energy_threshold_ratio": [0.05, 0.5], "min_segment_duration": [0.1, 0.2]},
+		base=main.PipelineConfig(vowel_backend="fast"),
+	)
+
+	df = sweep.run_sweep(configs, input_file=str(burst_file), output_dir=str(tmp_path / "sweep"))
+
+	assert set(df["config_id"]) == set(configs)
+	for config_id, config in configs.items():
+		expected = pd.DataFrame(list(main.iter_features(input_file=str(burst_file), config=config)))
+		actual = df[df["config_id"] == config_id].drop(columns="config_id").reset_index(drop=True)
+		pd.testing.assert_frame_equal(actual[expected.columns], expected, check_exact=False, rtol=1e-7)
+
+	config_table = pd.read_csv(tmp_path / "sweep" / "sweep_configs.csv")
+	assert list(config_table["config_id"]) == list(configs)
+
+
+@pytest.mark.integration
+def test_sweep_keeps_cached_and_uncached_signals_apart(burst_file, tmp_path):
+	configs = sweep.expand_grid(
+		{"signal_cache_dir": [str(tmp_path / "cache"), None]},
+		base=main.PipelineConfig(vowel_backend="fast"),
+	)
+
+	df = sweep.run_sweep(configs, input_file=str(burst_file), output_dir=None)
+
+	for config_id, config in configs.items():
+		expected = pd.DataFrame(list(main.iter_features(input_file=str(burst_file), config=config)))
+		actual = df[df["config_id"] == config_id].drop(columns="config_id").reset_index(drop=True)
+		pd.testing.assert_frame_equal(actual[expected.columns], expected, check_exact=False, rtol=1e-12)
+
+
+@pytest.mark.integration
+def test_sweep_cli_reads_grid(burst_file, tmp_path):
+	grid_path = tmp_path / "grid.json"
+	grid_path.write_text(json.dumps({"energy_threshold_ratio": [0.05, 0.1]}))
+	output_dir = tmp_path / "out"
+
+	exit_code = sweep.main(
+		["--input-file", str(burst_file), "--grid", str(grid_path), "--output-dir", str(output_dir)]
+	)
+
+	assert exit_code == 0
+	df = pd.read_csv(output_dir / "sweep_features.csv")
+	assert set(df["config_id"]) == {"cfg_001", "cfg_002"}
+
+
+def test_expand_grid_rejects_unknown_fields():
+	with pytest.raises(ValueError):
+		sweep.expand_grid({"not_a_field": [1]})
+
+
+def test_run_sweep_rejects_invalid_configs(burst_file):
+	configs = sweep.expand_grid({"segmentation": ["single", "bogus"]})
+	with pytest.raises(ValueError, match="segmentation"):
+		sweep.run_sweep(configs, input_file=str(burst_file), output_dir=None)
+
+
+@pytest.mark.integration
+def test_empty_sweep_lists_every_config_column(tmp_path):
+	(tmp_path / "no_inputs").mkdir()
+	configs = [main.PipelineConfig(n_mfcc=2), main.PipelineConfig(n_mfcc=4)]
+
+	df = sweep.run_sweep(configs, input_dir=str(tmp_path / "no_inputs"), output_dir=None)
+
+	assert df.empty
+	assert list(df.columns[:3]) == ["config_id", "segment_id", "source_file"]
+	assert set(df.columns) == {"config_id", *main._output_columns(configs[1])}
@@ -0,0 +1,50 @@
+import pytest
+from pathlib import Path
+
+from src.utils import discovery
+
+
+def test_iter_wav_files_finds_nested_wavs(tmp_path):
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    expected = {
+        tmp_path / "a.wav",
+        tmp_path / "nested" / "b.wav",
+        tmp_path / "nested" / "deeper" / "c.wav",
+    }
+    for path in expected:
+        path.write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    found = set(discovery.iter_wav_files(tmp_path))
+
+    assert found == expected
+
+
+def test_read_file_list_plain_text(tmp_path):
+    manifest = tmp_path / "inputs.txt"
+    manifest.write_text("# comment\nfirst.wav\n\n/abs/second.wav\n")
+
+    entries = list(discovery.read_file_list(manifest))
+
+    assert [entry.path for entry in entries] == [tmp_path / "first.wav", Path("/abs/second.wav")]
+    assert all(entry.duration is None for entry in entries)
+
+
+def test_read_file_list_csv_with_durations(tmp_path):
+    manifest = tmp_path / "inputs.csv"
+    manifest.write_text("path,duration\nfirst.wav,2.5\nsecond.wav,\n")
+
+    entries = list(discovery.read_file_list(manifest))
+
+    assert entries == [
+        discovery.ManifestEntry(tmp_path / "first.wav", 2.5),
+        discovery.ManifestEntry(tmp_path / "second.wav", None),
+    ]
+
+
+def test_read_file_list_rejects_bad_duration(tmp_path):
+    manifest = tmp_path / "inputs.csv"
+    manifest.write_text("path,duration\nfirst.wav,long\n")
+
+    with pytest.raises(ValueError):
+        list(discovery.read_file_list(manifest))
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from src.utils import audio_io, duration_index
+
+
+@pytest.fixture
+def wav_files(tmp_path):
+    paths = []
+    for name, seconds in (("short.wav", 0.5), ("long.wav", 2.0), ("medium.wav", 1.0)):
+        path = tmp_path / name
+        audio_io.save_wav(str(path), np.zeros(int(16000 * seconds)), 16000)
+        paths.append(path)
+    return paths
+
+
+def test_build_duration_index_reads_headers(wav_files):
+    durations = duration_index.build_duration_index(wav_files)
+
+    assert [durations[path] for path in wav_files] == pytest.approx([0.5, 2.0, 1.0])
+
+
+def test_duration_index_cache_round_trip(wav_files, tmp_path):
+    cache_path = tmp_path / "index" / "durations.csv"
+
+    duration_index.build_duration_index(wav_files, cache_path)
+    entries = duration_index.load_duration_index(cache_path)
+
+    assert len(entries) == 3
+    assert {entry.duration for entry in entries.values()} == {0.5, 2.0, 1.0}
+    assert duration_index.build_duration_index(wav_files, cache_path) == duration_index.build_duration_index(wav_files)
+
+
+def test_known_durations_skip_header_reads(tmp_path):
+    missing = tmp_path / "not_there.wav"
+
+    durations = duration_index.build_duration_index([missing], known_durations={missing: 12.5})
+
+    assert durations == {missing: 12.5}
+
+
+def test_schedule_longest_first(wav_files):
+    durations = duration_index.build_duration_index(wav_files)
+    unknown = wav_files[0].with_name("unknown.wav")
+
+    order = duration_index.schedule_longest_first(wav_files + [unknown], durations)
+
+    assert [path.name for path in order] == ["unknown.wav", "long.wav", "medium.wav", "short.wav"]
@@ -65,4 +65,22 @@ def test_analyze_vowel():
     assert "F0" in vowel_features
     assert "HNR" in vowel_features
     assert "Jitter" in vowel_features
-    assert "Shimmer" in vowel_features
\ No newline at end of file
+    assert "Shimmer" in vowel_features
+
+def test_analyze_vowels_fast_matches_synthetic_pitch():
+    """
+    The fast backend should recover F0 of voiced signals and flag silence.
+    """
+    sample_rate = 16000
+    t = np.arange(int(0.5 * sample_rate)) / sample_rate
+    voiced = np.sin(2 * np.pi * 150 * t) + 0.5 * np.sin(2 * np.pi * 300 * t)
+    silence = np.zeros_like(voiced)
+
+    voiced_features, silent_features = features.analyze_vowels_fast([voiced, silence], sample_rate)
+
+    assert voiced_features["F0"] == pytest.approx(150.0, rel=1e-3)
+    assert voiced_features["HNR"] > 30.0
+    assert voiced_features["Jitter"] < 0.001
+    assert voiced_features["Shimmer"] < 0.001
+    assert silent_features["F0"] == 0.0
+    assert np.isnan(silent_features["HNR"])
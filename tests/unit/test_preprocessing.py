@@ -65,4 +65,26 @@ def test_normalize_energy():
     normalized_signal = preprocessing.normalize_energy(signal)
 
     # Assert
-    assert np.max(np.abs(normalized_signal)) == pytest.approx(1.0)
\ No newline at end of file
+    assert np.max(np.abs(normalized_signal)) == pytest.approx(1.0)
+
+@pytest.mark.parametrize("block_length", [None, 37, 2_000])
+def test_coarse_to_fine_segmentation_matches_single_stage(block_length):
+    """The two-stage detector must reproduce the single-stage boundaries exactly."""
+    sample_rate = 16000
+    rng = np.random.default_rng(7)
+    signal = rng.normal(scale=0.01, size=10 * sample_rate)
+    for start, length, amplitude in [(3_000, 4_000, 0.9), (40_000, 1_700, 0.12), (150_000, 9_000, 0.5)]:
+        signal[start:start + length] += amplitude * np.sin(np.arange(length) * 0.07)
+    threshold = 0.1 * np.max(np.abs(signal))
+
+    expected = preprocessing.segment_by_energy(signal, sample_rate, 320, 160, threshold, 0.05)
+    actual = preprocessing.segment_by_energy_coarse_to_fine(
+        signal, sample_rate, 320, 160, threshold, 0.05, block_length
+    )
+
+    assert actual == expected
+    candidates = preprocessing.candidate_frames(signal, 320, 160, threshold, block_length)
+    energy = preprocessing.calculate_frame_energy(signal, 320, 160)
+    assert candidates.shape == energy.shape
+    assert candidates[energy > threshold].all()
+    assert candidates.mean() < 0.5
@@ -0,0 +1,19 @@
+import io
+
+from src.utils.progress import ProgressReporter
+
+
+def test_progress_reporter_estimates_remaining_time():
+    now = [0.0]
+    stream = io.StringIO()
+    reporter = ProgressReporter(total_files=3, total_seconds=40.0, stream=stream, clock=lambda: now[0])
+
+    now[0] = 10.0
+    reporter.update(10.0, "a.wav")
+    assert reporter.eta() == 30.0
+
+    now[0] = 20.0
+    line = reporter.update(10.0, "b.wav")
+    assert reporter.eta() == 20.0
+    assert line.startswith("[2/3]")
+    assert "a.wav" in stream.getvalue()
@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pytest
+
+from src.utils import audio_io
+from src.utils.signal_cache import SignalCache
+
+
+@pytest.fixture
+def wav_path(tmp_path):
+    path = tmp_path / "tone.wav"
+    audio_io.save_wav(str(path), 0.5 * np.sin(np.arange(8_000) * 0.05), 16_000)
+    return path
+
+
+def _counting_loader(calls):
+    def compute(path, target_rate):
+        calls.append(path)
+        signal, _ = audio_io.load_wav(str(path))
+        return signal
+
+    return compute
+
+
+def test_signal_cache_hit_is_memory_mapped(wav_path, tmp_path):
+    cache = SignalCache(tmp_path / "cache")
+    calls = []
+
+    first = cache.load_signal(wav_path, 16_000, _counting_loader(calls))
+    second = cache.load_signal(wav_path, 16_000, _counting_loader(calls))
+
+    assert len(calls) == 1
+    assert isinstance(second, np.memmap)
+    assert second.dtype == np.float32
+    np.testing.assert_array_equal(first, second)
+
+
+def test_signal_cache_detects_corruption(wav_path, tmp_path):
+    cache = SignalCache(tmp_path / "cache")
+    calls = []
+    cache.load_signal(wav_path, 16_000, _counting_loader(calls))
+
+    data_path = next((tmp_path / "cache").glob("*.npy"))
+    with open(data_path, "r+b") as handle:
+        handle.seek(-4, os.SEEK_END)
+        handle.write(b"\x00\x00\x80\x7f")
+
+    recovered = cache.load_signal(wav_path, 16_000, _counting_loader(calls))
+
+    assert len(calls) == 2
+    assert np.all(np.isfinite(recovered))
+
+
+def test_signal_cache_evicts_least_recently_used(tmp_path):
+    cache = SignalCache(tmp_path / "cache", max_bytes=100_000)
+    for index, key in enumerate(("old", "recent", "new")):
+        cache.put(key, np.zeros(10_000))
+        os.utime(tmp_path / "cache" / f"{key}.npy", ns=(index * 10**9, index * 10**9))
+
+    cache.put("newest", np.zeros(10_000))
+
+    remaining = {path.stem for path in (tmp_path / "cache").glob("*.npy")}
+    assert remaining == {"new", "newest"}
+    assert cache.size() <= 100_000
+
+
+def test_signal_cache_evicts_hash_memos_with_entries(tmp_path):
+    paths = []
+    for index in range(2):
+        path = tmp_path / f"tone_{index}.wav"
+        audio_io.save_wav(str(path), 0.5 * np.sin(np.arange(8_000) * (0.05 + index * 0.01)), 16_000)
+        paths.append(path)
+    cache = SignalCache(tmp_path / "cache", max_bytes=40_000)
+    calls = []
+
+    cache.load_signal(paths[0], 16_000, _counting_loader(calls))
+    os.utime(next((tmp_path / "cache").glob("*.npy")), ns=(0, 0))
+    cache.load_signal(paths[1], 16_000, _counting_loader(calls))
+
+    memos = list((tmp_path / "cache" / "hashes").iterdir())
+    assert len(memos) == 1
+    assert memos[0].read_text().strip() == cache.file_hash(paths[1])
+    assert cache.size() <= 40_000
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from src.analysis import features, preprocessing
+from src.analysis.signal_index import SignalIndex
+
+
+@pytest.fixture
+def signal():
+    rng = np.random.default_rng(7)
+    signal = rng.normal(scale=0.05, size=20_000)
+    signal[5_000:7_000] += np.sin(np.arange(2_000) * 0.2)
+    signal[12_000:12_500] = 0.0
+    return signal
+
+
+@pytest.mark.parametrize("start,end", [(0, 20_000), (4_900, 7_300), (100, 357), (12_000, 12_500), (3, 5)])
+def test_signal_index_matches_segment_functions(signal, start, end):
+    index = SignalIndex(signal, block_size=64)
+    segment = preprocessing.normalize_energy(signal[start:end])
+
+    assert index.peak(start, end) == pytest.approx(np.max(np.abs(signal[start:end])))
+    assert index.rms(start, end) == pytest.approx(features.calculate_rms_energy(segment))
+    assert index.zcr(start, end) == pytest.approx(features.calculate_zcr(segment))
+    assert index.crest_factor(start, end) == pytest.approx(features.calculate_crest_factor(segment))
+    np.testing.assert_allclose(
+        index.amplitude_contour(start, end, 320, 160),
+        features.calculate_amplitude_contour(segment, 320, 160),
+        atol=1e-9,
+    )
+
+
+def test_signal_index_keeps_float32_signal_without_copy(signal):
+    signal32 = signal.astype(np.float32)
+    index = SignalIndex(signal32, block_size=64)
+
+    assert np.shares_memory(index.signal, signal32)
+    segment = preprocessing.normalize_energy(signal32[4_900:7_300].astype(np.float64))
+    assert index.rms(4_900, 7_300) == pytest.approx(features.calculate_rms_energy(segment))
+    assert index.zcr(4_900, 7_300) == pytest.approx(features.calculate_zcr(segment))
+    assert index.peak(11_990, 12_600) == pytest.approx(float(np.max(np.abs(signal32[11_990:12_600]))))
@@ -13,4 +13,38 @@ def test_calculate_relative_energy():
 
     # Assert
     assert len(relative_energies) == len(bands)
-    assert np.isclose(np.sum(relative_energies), 1.0)
\ No newline at end of file
+    assert np.isclose(np.sum(relative_energies), 1.0)
+
+def test_compute_spectrograms_batches_segments():
+    sample_rate = 16000
+    signals = [np.random.randn(4000), np.random.randn(100), np.random.randn(9000)]
+
+    batched = spectral.compute_spectrograms(signals, sample_rate, n_fft=512, hop_length=160)
+
+    assert len(batched) == len(signals)
+    for signal, spectrogram in zip(signals, batched):
+        single = spectral.compute_spectrogram(signal, sample_rate, n_fft=512, hop_length=160)
+        assert np.allclose(spectrogram.power, single.power)
+    assert batched[1].n_frames == 1
+
+
+def test_spectral_centroid_of_pure_tone():
+    sample_rate = 16000
+    t = np.arange(sample_rate) / sample_rate
+    spectrogram = spectral.compute_spectrogram(np.sin(2 * np.pi * 1000 * t), sample_rate)
+
+    features = spectral.calculate_spectral_features(spectrogram, [(0, 1000), (1000, 8000)])
+
+    assert features["spectral_centroid"] == pytest.approx(1000.0, rel=1e-3)
+    assert features["spectral_flatness"] < 0.01
+    assert np.isclose(features["relative_energy_band_1"] + features["relative_energy_band_2"], 1.0)
+    assert "mfcc_13" in features
+
+
+def test_mel_filterbank_is_cached():
+    first = spectral.mel_filterbank(512, 16000)
+    second = spectral.mel_filterbank(512, 16000)
+
+    assert first is second
+    assert first.shape == (spectral.DEFAULT_N_MELS, 257)
+    assert not first.flags.writeable